@@ -3,18 +3,58 @@ Application manager for handling MIME types and desktop applications
 """
 import subprocess
 import os
-from pathlib import Path
+import sys
 import configparser
 import mimetypes
 import re
 from typing import List, Dict, Optional, Tuple, Iterable
 import glob
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_desktop_entry(path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a .desktop file once per (path, mtime, size).
+
+    Returns (name, exec_command, icon, no_display, hidden, mime_types,
+    categories, mime_set); an edited file gets a new key and is parsed again.
+    """
+    app = DesktopApplication.__new__(DesktopApplication)
+    app._init_fields(path)
+    app._parse_desktop_file()
+    # Interned: the same names, commands and MIME types repeat across the
+    # .desktop files of a system, and are compared when deduplicating/ranking
+    mime_types = tuple(sys.intern(mime) for mime in app.mime_types)
+    return (sys.intern(app.name), sys.intern(app.exec_command), app.icon,
+            app.no_display, app.hidden, mime_types, tuple(app.categories),
+            frozenset(mime_types))
 
 
 class DesktopApplication:
     """Represents a desktop application"""
 
+    # One instance per .desktop file on the system
+    __slots__ = ('path', 'name', 'exec_command', 'icon', 'mime_types', 'categories',
+                 'no_display', 'hidden', '_mime_set', '_stat_key',
+                 # First-occurrence markers of the manual parser
+                 '_no_display_set', '_hidden_set')
+
     def __init__(self, desktop_file_path: str):
+        self._init_fields(desktop_file_path)
+
+        try:
+            st = os.stat(desktop_file_path)
+        except OSError:
+            return
+        self._stat_key = (st.st_mtime_ns, st.st_size)
+        parsed = _parse_desktop_entry(desktop_file_path, st.st_mtime_ns, st.st_size)
+        self.name, self.exec_command, self.icon, self.no_display, self.hidden = parsed[:5]
+        # Fresh lists: the parsed entry is shared between instances
+        self.mime_types = list(parsed[5])
+        self.categories = list(parsed[6])
+        self._mime_set = parsed[7]
+
+    def _init_fields(self, desktop_file_path: str):
         self.path = desktop_file_path
         self.name = ""
         self.exec_command = ""
@@ -23,8 +63,10 @@ class DesktopApplication:
         self.categories = []
         self.no_display = False
         self.hidden = False
-
-        self._parse_desktop_file()
+        # MIME types as a set for can_handle_mime_type
+        self._mime_set = frozenset()
+        # (mtime_ns, size) of the file when it was read
+        self._stat_key = None
 
     def _parse_desktop_file(self):
         """Parse the .desktop file"""
@@ -121,7 +163,7 @@ class DesktopApplication:
 
     def can_handle_mime_type(self, mime_type: str) -> bool:
         """Check if this application can handle the given MIME type"""
-        return mime_type in self.mime_types
+        return mime_type in self._mime_set
 
     def should_be_visible(self) -> bool:
         """Check if this application should be visible in menus"""
@@ -212,8 +254,19 @@ class ApplicationManager:
             return True
         return mime.lower() in cls._GENERIC_MIME_TYPES
 
+    # (directories with their mtimes, applications) of the last scan, shared
+    # by all managers
+    _app_cache: Optional[Tuple[Tuple, List[DesktopApplication]]] = None
+
+    # Files whose MIME type is remembered per manager (least recently used
+    # entries are dropped first)
+    PATH_MIME_CACHE_SIZE = 4096
+
     def __init__(self, extra_desktop_dirs: Optional[Iterable[str]] = None):
             self._applications_cache: Optional[List[DesktopApplication]] = None
+            # Shared scan list _applications_cache and the caches derived from
+            # it were built from
+            self._applications_source: Optional[List[DesktopApplication]] = None
             self._mime_cache: Dict[str, List[DesktopApplication]] = {}
             self._rank_cache: Dict[Tuple, List[DesktopApplication]] = {}
             self._extra_desktop_dirs = list(extra_desktop_dirs) if extra_desktop_dirs else []
@@ -227,8 +280,10 @@ class ApplicationManager:
             try:
                 stat_info = os.stat(file_path)
                 cache_signature = (stat_info.st_mtime_ns, stat_info.st_size)
-                cached = self._path_mime_cache.get(file_path)
+                cached = self._path_mime_cache.pop(file_path, None)
                 if cached and cached[0] == cache_signature[0] and cached[1] == cache_signature[1]:
+                    # Re-inserted as the most recently used entry
+                    self._path_mime_cache[file_path] = cached
                     return cached[2]
             except (OSError, ValueError):
                 cache_signature = None
@@ -244,8 +299,7 @@ class ApplicationManager:
                 normalized_xdg_mime = self.normalize_mime_type(result.stdout.strip())
                 if normalized_xdg_mime and not self.is_generic_mime(normalized_xdg_mime):
                     resolved = normalized_xdg_mime
-                    if cache_signature is not None:
-                        self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+                    self._remember_mime(file_path, cache_signature, resolved)
                     return resolved
             except (subprocess.CalledProcessError, FileNotFoundError):
                 pass
@@ -255,37 +309,40 @@ class ApplicationManager:
         normalized_guess = self.normalize_mime_type(mime_type)
         if normalized_guess and not self.is_generic_mime(normalized_guess):
             resolved = normalized_guess
-            if cache_signature is not None:
-                self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+            self._remember_mime(file_path, cache_signature, resolved)
             return resolved
 
         # Extension-specific overrides for script-like files without shebangs
-        ext = Path(file_path).suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
         override_mime = self._EXTENSION_MIME_OVERRIDES.get(ext)
         if override_mime:
             resolved = override_mime
-            if cache_signature is not None:
-                self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+            self._remember_mime(file_path, cache_signature, resolved)
             return resolved
 
         # Return the best available generic MIME type fallback
         if normalized_xdg_mime:
             resolved = normalized_xdg_mime
-            if cache_signature is not None:
-                self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+            self._remember_mime(file_path, cache_signature, resolved)
             return resolved
         if normalized_guess:
             resolved = normalized_guess
-            if cache_signature is not None:
-                self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+            self._remember_mime(file_path, cache_signature, resolved)
             return resolved
 
         # Default fallback
         resolved = 'application/octet-stream'
-        if cache_signature is not None:
-            self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+        self._remember_mime(file_path, cache_signature, resolved)
         return resolved
 
+    def _remember_mime(self, file_path: str, cache_signature: Optional[Tuple[int, int]], resolved: str):
+        """Cache the MIME type of file_path, evicting the least recently used entry when full"""
+        if cache_signature is None:
+            return
+        if len(self._path_mime_cache) >= self.PATH_MIME_CACHE_SIZE:
+            del self._path_mime_cache[next(iter(self._path_mime_cache))]
+        self._path_mime_cache[file_path] = (cache_signature[0], cache_signature[1], resolved)
+
     def _get_mime_types_for_file(self, file_path: str) -> List[str]:
         """Get an ordered list of MIME types for a file.
 
@@ -299,14 +356,20 @@ class ApplicationManager:
         Returns:
             List of MIME types in priority order (most specific first)
         """
-        primary_mime = self.get_mime_type(file_path)
+        # get_mime_type caches per path; the chain depends only on its result
+        return list(self._mime_chain(self.get_mime_type(file_path)))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _mime_chain(primary_mime: str) -> Tuple[str, ...]:
+        """Primary MIME type followed by its fallbacks, see _get_mime_types_for_file"""
         mime_types = [primary_mime]
 
         # Parse the MIME type components
         if '/' in primary_mime:
             primary_type, sub_type = primary_mime.split('/', 1)
         else:
-            return mime_types
+            return tuple(mime_types)
 
         # Handle text/* files - most should also work with text/plain applications
         if primary_type == 'text':
@@ -447,7 +510,7 @@ class ApplicationManager:
                     if variant not in mime_types:
                         mime_types.append(variant)
 
-        return mime_types
+        return tuple(mime_types)
 
     def get_default_application(self, file_path: str) -> Optional[DesktopApplication]:
         """Get the default application for a file.
@@ -508,6 +571,8 @@ class ApplicationManager:
 
         (Exact matches only, no heuristics.)
         """
+        # Drops the cached results if installed applications changed
+        self._get_all_applications()
         if mime_type in self._mime_cache:
             return self._mime_cache[mime_type]
 
@@ -559,12 +624,13 @@ class ApplicationManager:
         file_ext = os.path.splitext(file_path)[1].lower()
         cache_key = (primary_mime, file_ext, tuple(mime_types))
 
+        # Drops the cached rankings if installed applications changed
+        all_apps = self._get_all_applications()
         if cache_key in self._rank_cache:
             return self._rank_cache[cache_key]
 
         # Build candidate set with scoring
         candidates: Dict[Tuple[str, str], Tuple[DesktopApplication, int]] = {}
-        all_apps = self._get_all_applications()
 
         def add_with_score(app: DesktopApplication, score: int):
             # Normalize by name and exec command to avoid duplicates from different .desktop files
@@ -580,6 +646,18 @@ class ApplicationManager:
             if default_app and default_app.path not in default_apps:
                 default_apps[default_app.path] = (default_app, i)
 
+        # Per-file heuristics, the same for every application
+        primary_type = primary_mime.split('/')[0] if '/' in primary_mime else ''
+        is_office = primary_mime.startswith(('application/vnd.oasis.opendocument',
+                                             'application/vnd.openxmlformats-officedocument',
+                                             'application/msword', 'application/vnd.ms-'))
+        editor_tokens = None
+        if primary_type == 'text' or primary_mime in [
+            'application/json', 'application/javascript', 'application/xml',
+            'application/x-php', 'application/x-python'
+        ]:
+            editor_tokens = self._get_editor_exec_tokens()
+
         # Score applications based on MIME type matches
         for app in all_apps:
             if not app.should_be_visible():
@@ -602,22 +680,13 @@ class ApplicationManager:
                     else:  # Subsequent fallbacks
                         max_score = max(max_score, 15)
 
-            # Additional heuristic bonuses
-            primary_type = primary_mime.split('/')[0] if '/' in primary_mime else ''
-
             # Office category bonus for office documents
-            if primary_mime.startswith(('application/vnd.oasis.opendocument',
-                                      'application/vnd.openxmlformats-officedocument',
-                                      'application/msword', 'application/vnd.ms-')):
+            if is_office:
                 if ('Office' in app.categories) or ('WordProcessor' in app.categories):
                     max_score = max(max_score, max_score + 10)
 
             # Editor heuristic bonus for text files
-            if primary_type == 'text' or primary_mime in [
-                'application/json', 'application/javascript', 'application/xml',
-                'application/x-php', 'application/x-python'
-            ]:
-                editor_tokens = self._get_editor_exec_tokens()
+            if editor_tokens is not None:
                 exec_base = os.path.basename(app.exec_command.split()[0]) if app.exec_command else ''
                 lowered = exec_base.lower()
                 if any(tok in lowered for tok in editor_tokens):
@@ -626,11 +695,13 @@ class ApplicationManager:
             if max_score > 0:
                 add_with_score(app, max_score)
 
-        # Build ranked list
-        ranked = sorted(
-            (a for a, s in candidates.values()),
-            key=lambda a: (-candidates[(a.name, a.exec_command)][1], a.name.lower())
-        )
+        # Build ranked list; candidates is keyed by (name, exec_command), so
+        # duplicates are already gone and each keeps its best score
+        ranked = [
+            app for app, _score in sorted(
+                candidates.values(), key=lambda c: (-c[1], c[0].name.lower())
+            )
+        ]
 
         self._rank_cache[cache_key] = ranked
         return ranked
@@ -701,10 +772,7 @@ class ApplicationManager:
         return False
 
     def _get_all_applications(self) -> List[DesktopApplication]:
-        """Get all desktop applications (cached)."""
-        if self._applications_cache is not None:
-            return self._applications_cache
-
+        """Get all desktop applications, re-reading only what changed on disk."""
         applications: List[DesktopApplication] = []
 
         # Base XDG data dirs (spec: defaults to /usr/local/share:/usr/share)
@@ -737,28 +805,67 @@ class ApplicationManager:
             + self._extra_desktop_dirs
         )
 
-        seen_paths = set()
+        # Adding, removing or renaming a .desktop file changes its directory's
+        # mtime, so unchanged mtimes mean the last scan's file list is valid
+        scan_key = []
         for desktop_dir in desktop_dirs:
-            if not os.path.isdir(desktop_dir):
+            try:
+                scan_key.append((desktop_dir, os.stat(desktop_dir).st_mtime_ns))
+            except OSError:
+                scan_key.append((desktop_dir, None))
+        scan_key = tuple(scan_key)
+        cached = ApplicationManager._app_cache
+        if cached is not None and cached[0] == scan_key:
+            # Editing a .desktop file in place leaves its directory's mtime
+            # alone; re-read just the files whose own stat changed
+            changed = False
+            for app in cached[1]:
+                try:
+                    st = os.stat(app.path)
+                except OSError:
+                    changed = True
+                    continue
+                if app._stat_key != (st.st_mtime_ns, st.st_size):
+                    app = DesktopApplication(app.path)
+                    changed = True
+                applications.append(app)
+            if changed:
+                ApplicationManager._app_cache = (scan_key, applications)
+            return self._use_applications(ApplicationManager._app_cache[1])
+
+        seen_paths = set()
+        for desktop_dir, mtime_ns in scan_key:
+            if mtime_ns is None:
                 continue
             try:
-                for filename in os.listdir(desktop_dir):
-                    if not filename.endswith('.desktop'):
-                        continue
-                    desktop_path = os.path.join(desktop_dir, filename)
-                    if desktop_path in seen_paths:
-                        continue
-                    try:
-                        app = DesktopApplication(desktop_path)
-                        # Don't filter here; filtering & scoring happens later
-                        applications.append(app)
-                        seen_paths.add(desktop_path)
-                    except Exception:
-                        continue
+                with os.scandir(desktop_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith('.desktop'):
+                            continue
+                        desktop_path = entry.path
+                        if desktop_path in seen_paths:
+                            continue
+                        try:
+                            app = DesktopApplication(desktop_path)
+                            # Don't filter here; filtering & scoring happens later
+                            applications.append(app)
+                            seen_paths.add(desktop_path)
+                        except Exception:
+                            continue
             except OSError:
                 continue
-        self._applications_cache = applications
-        return applications
+        ApplicationManager._app_cache = (scan_key, applications)
+        return self._use_applications(applications)
+
+    def _use_applications(self, applications: List[DesktopApplication]) -> List[DesktopApplication]:
+        """Switch to the shared scan list applications, dropping results derived from an older one"""
+        if applications is not self._applications_source:
+            self._applications_source = applications
+            self._applications_cache = list(applications)
+            self._mime_cache.clear()
+            self._rank_cache.clear()
+            self._editor_tokens_cache = None
+        return self._applications_cache
 
     def set_default_application(self, mime_type: str, desktop_file: str) -> bool:
         """Set the default application for a MIME type"""
@@ -768,9 +875,10 @@ class ApplicationManager:
                 check=True, capture_output=True
             )
 
-            # Clear cache
+            # Clear cache; rankings include the system default boost
             if mime_type in self._mime_cache:
                 del self._mime_cache[mime_type]
+            self._rank_cache.clear()
 
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
@@ -812,3 +920,14 @@ class ApplicationManager:
                     return app
 
         return None
+
+
+_app_manager: Optional[ApplicationManager] = None
+
+
+def get_app_manager() -> ApplicationManager:
+    """Return the process-wide ApplicationManager, created on first use"""
+    global _app_manager
+    if _app_manager is None:
+        _app_manager = ApplicationManager()
+    return _app_manager
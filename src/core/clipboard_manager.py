@@ -20,24 +20,44 @@ class ClipboardContent:
     paths: List[str]
 
 
+@dataclass
+class ClipboardPayload:
+    """Pre-serialized clipboard data; can be built off the GUI thread."""
+    operation: str
+    gnome_data: bytes
+    text: str
+    abs_paths: List[str]
+
+
 class ClipboardManager:
     @staticmethod
-    def set_files(paths: List[str], operation: str = 'copy') -> None:
+    def build_payload(paths: List[str], operation: str = 'copy') -> ClipboardPayload:
+        """Serialize paths for the clipboard. Pure Python, safe to run in a worker thread."""
         if operation not in ('copy', 'cut'):
             operation = 'copy'
-        mime = QMimeData()
+        abs_paths = [os.path.abspath(p) for p in paths]
         lines = [operation]
-        for p in paths:
-            lines.append('file://' + os.path.abspath(p))
+        for p in abs_paths:
+            lines.append('file://' + p)
         payload = '\n'.join(lines)
-        mime.setData(GNOME_MIME, payload.encode('utf-8'))
+        return ClipboardPayload(operation, payload.encode('utf-8'), '\n'.join(abs_paths), abs_paths)
+
+    @staticmethod
+    def set_payload(payload: ClipboardPayload) -> None:
+        """Put a serialized payload on the clipboard. Must run on the GUI thread."""
+        mime = QMimeData()
+        mime.setData(GNOME_MIME, payload.gnome_data)
         # KDE expects an extra MIME with 1 (cut) or 0 (copy)
-        mime.setData(KDE_CUT_MIME, b'1' if operation == 'cut' else b'0')
-        mime.setText('\n'.join([os.path.abspath(p) for p in paths]))
-        urls = [QUrl.fromLocalFile(os.path.abspath(p)) for p in paths]
+        mime.setData(KDE_CUT_MIME, b'1' if payload.operation == 'cut' else b'0')
+        mime.setText(payload.text)
+        urls = [QUrl.fromLocalFile(p) for p in payload.abs_paths]
         mime.setUrls(urls)
         QGuiApplication.clipboard().setMimeData(mime, QClipboard.Mode.Clipboard)
 
+    @staticmethod
+    def set_files(paths: List[str], operation: str = 'copy') -> None:
+        ClipboardManager.set_payload(ClipboardManager.build_payload(paths, operation))
+
     @staticmethod
     def get_files() -> Optional[ClipboardContent]:
         cb = QGuiApplication.clipboard()
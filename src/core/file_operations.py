@@ -7,37 +7,104 @@ import subprocess
 import shlex
 from pathlib import Path
 from datetime import datetime
+import re
 import stat
+from functools import lru_cache
+from typing import Tuple
+
+# get_executable_type results by (path, st_mtime_ns, st_size); classifying a
+# binary runs ldd and file, so repeat queries are answered from here
+_exec_type_cache = {}
+_EXEC_TYPE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1)
+def _login_shells():
+    """Paths listed in /etc/shells, read on first use"""
+    try:
+        with open('/etc/shells') as f:
+            return frozenset(line.strip() for line in f
+                             if line.strip() and not line.startswith('#'))
+    except OSError:
+        return frozenset()
+
+
+# Filesystem types where a stat() may block for a long time
+_NETWORK_FS_TYPES = {
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', 'sshfs',
+    'autofs', 'davfs', 'fuse.davfs2', 'afs', '9p', 'ceph', 'glusterfs',
+}
+
+
+@lru_cache(maxsize=1)
+def network_mount_points() -> Tuple[str, ...]:
+    """Mount points of network/automount filesystems (read once per process)"""
+    mount_points = []
+    try:
+        with open('/proc/self/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3 and fields[2] in _NETWORK_FS_TYPES:
+                    # Spaces etc. are octal-escaped in /proc/mounts
+                    mount_points.append(re.sub(r'\\([0-7]{3})',
+                                               lambda m: chr(int(m.group(1), 8)), fields[1]))
+    except OSError:
+        pass
+    return tuple(mount_points)
+
+
+def is_on_network_mount(path: str) -> bool:
+    """Return True if path lies on a network or automounted filesystem"""
+    for mount_point in network_mount_points():
+        if path == mount_point or path.startswith(mount_point.rstrip('/') + '/'):
+            return True
+    return False
 
 class FileOperations:
     @staticmethod
     def get_file_info(path):
-        """Get comprehensive file information"""
+        """Get comprehensive file information.
+
+        Everything is derived from a single stat() (plus an lstat() for
+        symlink detection) instead of querying the filesystem per field.
+        """
         path_obj = Path(path)
-        if not path_obj.exists():
+        try:
+            stat_info = os.stat(path_obj)
+            is_symlink = stat.S_ISLNK(os.lstat(path_obj).st_mode)
+        except OSError:
+            # Missing, dangling symlink, symlink loop or inaccessible
             return None
 
-        stat_info = path_obj.stat()
-
-        return {
+        mode = stat_info.st_mode
+        info = {
             'name': path_obj.name,
             'path': str(path_obj),
-            'is_dir': path_obj.is_dir(),
-            'is_file': path_obj.is_file(),
-            'is_symlink': path_obj.is_symlink(),
+            'is_dir': stat.S_ISDIR(mode),
+            'is_file': stat.S_ISREG(mode),
+            'is_symlink': is_symlink,
             'size': stat_info.st_size,
             'modified': datetime.fromtimestamp(stat_info.st_mtime),
             'created': datetime.fromtimestamp(stat_info.st_ctime),
-            'permissions': stat.filemode(stat_info.st_mode),
-            'owner_read': bool(stat_info.st_mode & stat.S_IRUSR),
-            'owner_write': bool(stat_info.st_mode & stat.S_IWUSR),
-            'owner_execute': bool(stat_info.st_mode & stat.S_IXUSR),
-            'group_read': bool(stat_info.st_mode & stat.S_IRGRP),
-            'group_write': bool(stat_info.st_mode & stat.S_IWGRP),
-            'group_execute': bool(stat_info.st_mode & stat.S_IXGRP),
-            'other_read': bool(stat_info.st_mode & stat.S_IROTH),
-            'other_write': bool(stat_info.st_mode & stat.S_IWOTH),
-            'other_execute': bool(stat_info.st_mode & stat.S_IXOTH),
+        }
+        info.update(FileOperations.permission_info(mode))
+        return info
+
+    @staticmethod
+    def permission_info(mode):
+        """Permission fields of a file info dict, derived from a full st_mode"""
+        return {
+            'mode': mode,
+            'permissions': stat.filemode(mode),
+            'owner_read': bool(mode & stat.S_IRUSR),
+            'owner_write': bool(mode & stat.S_IWUSR),
+            'owner_execute': bool(mode & stat.S_IXUSR),
+            'group_read': bool(mode & stat.S_IRGRP),
+            'group_write': bool(mode & stat.S_IWGRP),
+            'group_execute': bool(mode & stat.S_IXGRP),
+            'other_read': bool(mode & stat.S_IROTH),
+            'other_write': bool(mode & stat.S_IWOTH),
+            'other_execute': bool(mode & stat.S_IXOTH),
         }
 
     @staticmethod
@@ -151,22 +218,36 @@ class FileOperations:
         """Determine the type of executable: 'gui', 'console', or 'script'"""
         try:
             path_obj = Path(path)
-            if not path_obj.exists() or path_obj.is_dir():
-                return None
-
-            # Check if it's a script based on file extension or shebang
-            if FileOperations._is_script(path_obj):
-                return 'script'
+            stat_info = os.stat(path_obj)
+        except (OSError, ValueError):
+            return None
+        if stat.S_ISDIR(stat_info.st_mode):
+            return None
 
-            # Check if it's a GUI application
-            if FileOperations._is_gui_executable(path_obj):
-                return 'gui'
+        # Login shells are console programs; no need to inspect them
+        if str(path_obj) in _login_shells():
+            return 'console'
 
+        key = (str(path_obj), stat_info.st_mtime_ns, stat_info.st_size)
+        exec_type = _exec_type_cache.get(key)
+        if exec_type is not None:
+            return exec_type
+
+        # Check if it's a script based on file extension or shebang
+        if FileOperations._is_script(path_obj):
+            exec_type = 'script'
+        # Check if it's a GUI application
+        elif FileOperations._is_gui_executable(path_obj):
+            exec_type = 'gui'
+        else:
             # Default to console application
-            return 'console'
+            exec_type = 'console'
 
-        except (OSError, IOError):
-            return None
+        if len(_exec_type_cache) >= _EXEC_TYPE_CACHE_SIZE:
+            # Drop the oldest entry
+            del _exec_type_cache[next(iter(_exec_type_cache))]
+        _exec_type_cache[key] = exec_type
+        return exec_type
 
     @staticmethod
     def _is_script(path_obj):
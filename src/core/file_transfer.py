@@ -5,6 +5,7 @@ import os
 import shutil
 import threading
 import tempfile
+import time
 import urllib.request
 import urllib.parse
 import re
@@ -81,6 +82,9 @@ class FileTransferTask(QObject):
     finished = pyqtSignal(bool, str)
     file_progress = pyqtSignal(str)
 
+    PROGRESS_EMIT_INTERVAL = 0.05  # seconds
+    PROGRESS_EMIT_BYTES = 1 << 20
+
     def __init__(self, sources: List[str], destination_dir: str, move: bool,
                  conflict_callback: Optional[Callable[[Path, Path], ConflictDecision]] = None):
         super().__init__()
@@ -95,6 +99,10 @@ class FileTransferTask(QObject):
         self._apply_all_overwrite = False
         self._last_emit_monotonic = 0.0
         self._emit_interval = 0.2  # seconds
+        # progress_changed is emitted at most every PROGRESS_EMIT_INTERVAL
+        # seconds or PROGRESS_EMIT_BYTES copied, whichever comes first
+        self._last_progress_bytes = 0
+        self._last_progress_monotonic = 0.0
 
     def start(self):
         self._thread = threading.Thread(target=self._run, daemon=True)
@@ -219,6 +227,17 @@ class FileTransferTask(QObject):
             else:
                 self._copy_file(entry, target)
 
+    def _emit_progress(self, now: float, force: bool = False):
+        """Emit progress_changed unless the last emit was too recent"""
+        if self._done == self._last_progress_bytes:
+            return
+        if (force
+                or self._done - self._last_progress_bytes >= self.PROGRESS_EMIT_BYTES
+                or now - self._last_progress_monotonic >= self.PROGRESS_EMIT_INTERVAL):
+            self._last_progress_bytes = self._done
+            self._last_progress_monotonic = now
+            self.progress_changed.emit(self._done, self._total)
+
     def _copy_file(self, src: Path, dest: Path):
         # Check per-file conflict (if destination exists and overwrite-all not set)
         if dest.exists() and not self._apply_all_overwrite:
@@ -237,13 +256,14 @@ class FileTransferTask(QObject):
                         break
                     wf.write(chunk)
                     self._done += len(chunk)
-                    self.progress_changed.emit(self._done, self._total)
+                    now = time.monotonic()
+                    self._emit_progress(now)
                     # Throttle file_progress to reduce UI repaint pressure
-                    import time as _t
-                    now = _t.monotonic()
                     if now - self._last_emit_monotonic >= self._emit_interval:
                         self._last_emit_monotonic = now
                         self.file_progress.emit(str(dest))
+                # Always report where a file ends
+                self._emit_progress(time.monotonic(), force=True)
             try:
                 shutil.copystat(src, temp)
             except OSError:
@@ -421,6 +441,7 @@ class DownloadTask(QObject):
 
 class FileTransferManager(QObject):
     task_added = pyqtSignal(object)
+    tasks_idle = pyqtSignal()  # emitted when the last active task finishes
 
     def __init__(self):
         super().__init__()
@@ -437,7 +458,7 @@ class FileTransferManager(QObject):
                        conflict_callback=None) -> FileTransferTask:
         task = FileTransferTask(sources, destination_dir, move, conflict_callback)
         self._tasks.append(task)
-        task.finished.connect(lambda *_: self._tasks.remove(task) if task in self._tasks else None)
+        task.finished.connect(lambda *_: self._on_task_finished(task))
         self.task_added.emit(task)
         task.start()
         return task
@@ -446,10 +467,16 @@ class FileTransferManager(QObject):
                        conflict_callback=None) -> DownloadTask:
         task = DownloadTask(urls, destination_dir, conflict_callback)
         self._tasks.append(task)
-        task.finished.connect(lambda *_: self._tasks.remove(task) if task in self._tasks else None)
+        task.finished.connect(lambda *_: self._on_task_finished(task))
         self.task_added.emit(task)
         task.start()
         return task
 
+    def _on_task_finished(self, task: QObject):
+        if task in self._tasks:
+            self._tasks.remove(task)
+            if not self._tasks:
+                self.tasks_idle.emit()
+
     def active_tasks(self):
         return list(self._tasks)
@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from pathlib import Path
+import os
 
 
 class ConflictDialog(QDialog):
@@ -32,6 +33,9 @@ class ConflictDialog(QDialog):
         self._original_name = filename
         self._source_path = source_path
         self._existing_path = existing_path
+        # Names in the destination directory, listed once on first need and
+        # reused for the dialog's lifetime (see refresh_siblings)
+        self._sibling_names = None
 
         # Determine types for context-aware UI
         self._src_is_dir = False
@@ -249,17 +253,26 @@ class ConflictDialog(QDialog):
         if not stem:
             return filename
 
-        # Try incrementing numbers until we find an available name
-        n = 1
-        while True:
-            candidate = f"{stem} ({n}){suffix}"
-            candidate_path = parent_dir / candidate
-            if not candidate_path.exists():
-                return candidate
+        # "foo (1)" is usually free, which costs a single lstat
+        candidate = f"{stem} (1){suffix}"
+        if not os.path.lexists(parent_dir / candidate):
+            return candidate
+
+        # Otherwise list the directory once rather than a stat per taken number
+        self.refresh_siblings()
+        names = self._sibling_names or set()
+        n = 2
+        while f"{stem} ({n}){suffix}" in names:
             n += 1
-            # Safety limit to prevent infinite loop (unlikely but defensive)
-            if n > 1000:
-                return f"{stem} ({n}){suffix}"
+        return f"{stem} ({n}){suffix}"
+
+    def refresh_siblings(self):
+        """Re-list the destination directory used to validate rename input"""
+        try:
+            with os.scandir(os.path.dirname(self._existing_path)) as it:
+                self._sibling_names = {entry.name for entry in it}
+        except OSError:
+            self._sibling_names = None
 
     def _format_size(self, n: int) -> str:
         units = ['B', 'KB', 'MB', 'GB', 'TB']
@@ -282,11 +295,16 @@ class ConflictDialog(QDialog):
                 enable = False
             else:
                 # Check if the proposed new name already exists in destination
+                # lexists: a dangling symlink still occupies the name
                 name_exists = False
                 if self._existing_path:
-                    parent_dir = Path(self._existing_path).parent
-                    candidate_path = parent_dir / txt
-                    name_exists = candidate_path.exists()
+                    if self._sibling_names is None and '/' not in txt:
+                        self.refresh_siblings()
+                    if self._sibling_names is not None and '/' not in txt:
+                        name_exists = txt in self._sibling_names
+                    else:
+                        parent_dir = os.path.dirname(self._existing_path)
+                        name_exists = os.path.lexists(os.path.join(parent_dir, txt))
 
                 if name_exists:
                     # Conflict with a different existing name -> show warning
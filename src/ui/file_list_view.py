@@ -192,6 +192,8 @@ class FileListView(QTreeView):
         self.proxy_model = FileSortProxyModel()
         self.proxy_model.setSourceModel(self.source_model)
         self.setModel(self.proxy_model)
+        # Source model row of each listed name, rebuilt by refresh()
+        self._name_to_row = {}
 
         self.setup_ui()
         self.setup_connections()
@@ -701,6 +703,7 @@ class FileListView(QTreeView):
 
         self.source_model.clear()
         self.source_model.setHorizontalHeaderLabels(["Name", "Size", "Modified"])
+        self._name_to_row = {}
 
         # Populate model
         if not self.current_path or not os.path.isdir(self.current_path):
@@ -730,9 +733,11 @@ class FileListView(QTreeView):
             modified_item = QStandardItem("")
             modified_item.setEditable(False)
             if entry.get('modified') and isinstance(entry['modified'], datetime):
-                modified_str = entry['modified'].strftime("%Y-%m-%d %H:%M")
+                # Same as strftime("%Y-%m-%d %H:%M"), without parsing a format per row
+                modified_str = entry['modified'].isoformat(' ', 'minutes')
                 modified_item.setText(modified_str)
                 modified_item.setData(entry['modified'], Qt.ItemDataRole.UserRole)
+            self._name_to_row[entry['name']] = self.source_model.rowCount()
             self.source_model.appendRow([name_item, size_item, modified_item])
 
         # Sort and update
@@ -929,21 +934,23 @@ class FileListView(QTreeView):
                         selected.append(path)
         return selected
 
+    def row_for_name(self, name) -> int:
+        """Source model row of the item named name, or -1 if not listed."""
+        return self._name_to_row.get(name, -1)
+
     def select_item_by_name(self, name, ensure_visible=True):
         """Select an item by filename and optionally ensure it is visible."""
-        for row in range(self.source_model.rowCount()):
-            item = self.source_model.item(row, 0)
-            if item:
-                item_path = item.data(Qt.ItemDataRole.UserRole)
-                if os.path.basename(item_path) == name:
-                    # Map to proxy model index and select
-                    source_index = self.source_model.index(row, 0)
-                    proxy_index = self.proxy_model.mapFromSource(source_index)
-                    if proxy_index.isValid():
-                        self.setCurrentIndex(proxy_index)
-                        if ensure_visible:
-                            self.scrollTo(proxy_index, QAbstractItemView.ScrollHint.EnsureVisible)
-                        return True
+        row = self.row_for_name(name)
+        if row < 0:
+            return False
+        # Map to proxy model index and select
+        source_index = self.source_model.index(row, 0)
+        proxy_index = self.proxy_model.mapFromSource(source_index)
+        if proxy_index.isValid():
+            self.setCurrentIndex(proxy_index)
+            if ensure_visible:
+                self.scrollTo(proxy_index, QAbstractItemView.ScrollHint.EnsureVisible)
+            return True
         return False
 
     def prepare_selection(self, names: List[str], ensure_visible: bool = True):
@@ -5,9 +5,10 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QToolBar, QPushButton, QTabWidget, QLineEdit,
                              QMessageBox, QInputDialog, QSplitter, QFrame,
                              QMenu, QDialog, QTabBar, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QFileSystemWatcher, QObject, QEventLoop
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QFileSystemWatcher, QObject, QEventLoop, QThreadPool
 from PyQt6.QtGui import QKeySequence, QShortcut, QAction, QIcon, QKeyEvent
 from pathlib import Path
+from collections import OrderedDict
 import os
 
 from ui.path_navigator import PathNavigator
@@ -820,9 +821,28 @@ class FileTab(QWidget):
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    # Clipboard payload serialized in a worker thread: (generation, payload)
+    _clipboard_payload_ready = pyqtSignal(int, object)
+
+    # Selections at least this large are serialized off the GUI thread
+    ASYNC_CLIPBOARD_THRESHOLD = 100
+
+    # Number of tabs remembered for Ctrl+Tab recent switching
+    RECENT_TAB_HISTORY = 10
+
+    # Dialog classes, imported lazily on first use and cached here
+    _PropertiesDialog = None
+    _ApplicationSelectionDialog = None
+    _ConflictDialog = None
+
     def __init__(self):
         super().__init__()
         self.settings = Settings()
+        self._app_manager = None
+        # Bumped on every copy/cut so a slow background serialization can't
+        # overwrite a newer clipboard selection
+        self._clipboard_generation = 0
+        self._clipboard_payload_ready.connect(self._apply_clipboard_payload)
         self.transfer_manager = FileTransferManager()
         # Signal-based conflict dialog marshaling
         # We'll create a lightweight helper QObject living in the GUI thread to show the dialog.
@@ -835,14 +855,26 @@ class MainWindow(QMainWindow):
         self._refresh_timer.setSingleShot(True)
         self._refresh_timer.setInterval(250)  # ms
         self._refresh_timer.timeout.connect(self._refresh_visible_tab)
-
-        # Track recently used tab order (most recent first) for Ctrl+Tab switching
-        self.recent_tab_order = []
+        # Hide the transfer panel shortly after the last transfer finishes;
+        # restarted on every idle signal so bursts of transfers don't flash it
+        self._hide_panel_timer = QTimer(self)
+        self._hide_panel_timer.setSingleShot(True)
+        self._hide_panel_timer.setInterval(500)  # ms
+        self._hide_panel_timer.timeout.connect(self._hide_transfer_panel)
+        self.transfer_manager.tasks_idle.connect(self._hide_panel_timer.start)
+
+        # Track recently used tab order (most recent first) for Ctrl+Tab switching.
+        # Only the keys are used; OrderedDict gives O(1) membership and reordering.
+        self.recent_tab_order: OrderedDict[int, None] = OrderedDict()
 
         self.setup_ui()
         self.setup_shortcuts()
         self.restore_settings()
 
+        # Warm the path completer for the home directory once the event loop
+        # is idle, so the first Ctrl+L doesn't pay for the directory read
+        QTimer.singleShot(0, lambda: PathNavigator.warm_completer_cache(Path.home()))
+
     def setup_ui(self):
         """Setup the main window UI"""
         self.setWindowTitle("LitterBox")
@@ -1109,25 +1141,50 @@ class MainWindow(QMainWindow):
             if selected_items:
                 self.show_properties(selected_items[0])
 
+    @classmethod
+    def _get_properties_dialog_class(cls):
+        if MainWindow._PropertiesDialog is None:
+            from ui.properties_dialog import PropertiesDialog
+            MainWindow._PropertiesDialog = PropertiesDialog
+        return MainWindow._PropertiesDialog
+
+    @classmethod
+    def _get_application_selection_dialog_class(cls):
+        if MainWindow._ApplicationSelectionDialog is None:
+            from ui.application_selection_dialog import ApplicationSelectionDialog
+            MainWindow._ApplicationSelectionDialog = ApplicationSelectionDialog
+        return MainWindow._ApplicationSelectionDialog
+
+    @classmethod
+    def _get_conflict_dialog_class(cls):
+        if MainWindow._ConflictDialog is None:
+            from ui.conflict_dialog import ConflictDialog
+            MainWindow._ConflictDialog = ConflictDialog
+        return MainWindow._ConflictDialog
+
+    @property
+    def app_manager(self):
+        """Process-wide ApplicationManager, created on first use"""
+        if self._app_manager is None:
+            from core.application_manager import get_app_manager
+            self._app_manager = get_app_manager()
+        return self._app_manager
+
     def show_properties(self, path):
         """Show properties dialog"""
-        from ui.properties_dialog import PropertiesDialog
-        dialog = PropertiesDialog(path, self)
+        dialog = self._get_properties_dialog_class()(path, self)
         dialog.exec()
 
     def show_open_with_dialog(self, path):
         """Show Open with dialog"""
-        from ui.application_selection_dialog import ApplicationSelectionDialog
-        dialog = ApplicationSelectionDialog(path, self)
+        dialog = self._get_application_selection_dialog_class()(path, self)
         dialog.application_selected.connect(lambda app: self.open_with_application(path, app))
         dialog.default_changed.connect(lambda app: self.on_default_application_changed(path, app))
         dialog.exec()
 
     def open_with_application(self, path, application):
         """Open file with the specified application"""
-        from core.application_manager import ApplicationManager
-        app_manager = ApplicationManager()
-        success, error = app_manager.open_with_application(path, application)
+        success, error = self.app_manager.open_with_application(path, application)
         if not success:
             QMessageBox.warning(self, "Open Failed", f"Could not open with {application.name}:\n{error}")
 
@@ -1168,28 +1225,26 @@ class MainWindow(QMainWindow):
 
     def update_recent_tab_order(self, index):
         """Update the recently used tab order"""
-        # Remove the index if it's already in the list
-        if index in self.recent_tab_order:
-            self.recent_tab_order.remove(index)
+        # Move the index to the beginning (most recent)
+        self.recent_tab_order[index] = None
+        self.recent_tab_order.move_to_end(index, last=False)
 
-        # Add the index at the beginning (most recent)
-        self.recent_tab_order.insert(0, index)
-
-        # Keep only the last few tabs in history (prevent unlimited growth)
-        max_history = 10
-        self.recent_tab_order = self.recent_tab_order[:max_history]
+        # Keep only the last few tabs in history (prevent unlimited growth);
+        # at most one entry is ever over the limit
+        if len(self.recent_tab_order) > self.RECENT_TAB_HISTORY:
+            self.recent_tab_order.popitem(last=True)
 
     def update_recent_tab_order_on_close(self, closed_index):
         """Update recent tab order when a tab is closed"""
         # Remove the closed tab from the order
-        if closed_index in self.recent_tab_order:
-            self.recent_tab_order.remove(closed_index)
+        self.recent_tab_order.pop(closed_index, None)
 
         # Adjust indices for tabs that come after the closed tab
         # (their indices will shift down by 1)
-        for i in range(len(self.recent_tab_order)):
-            if self.recent_tab_order[i] > closed_index:
-                self.recent_tab_order[i] -= 1
+        self.recent_tab_order = OrderedDict(
+            (idx - 1 if idx > closed_index else idx, None)
+            for idx in self.recent_tab_order
+        )
 
     def keyPressEvent(self, a0):  # type: ignore[override]
         """Handle global key events (delegate to base)."""
@@ -1204,31 +1259,23 @@ class MainWindow(QMainWindow):
         if from_index == to_index:
             return
 
-        updated = []
-        for idx in self.recent_tab_order:
+        if from_index < to_index:
+            # Moved right: tabs between (from_index, to_index] shift left by 1
+            low, high, delta = from_index + 1, to_index, -1
+        else:
+            # Moved left: tabs between [to_index, from_index) shift right by 1
+            low, high, delta = to_index, from_index - 1, 1
+
+        def shift(idx: int) -> int:
             if idx == from_index:
-                updated.append(to_index)
-            elif from_index < to_index:
-                # Moved right: tabs between (from_index, to_index] shift left by 1
-                if from_index < idx <= to_index:
-                    updated.append(idx - 1)
-                else:
-                    updated.append(idx)
-            else:  # from_index > to_index
-                # Moved left: tabs between [to_index, from_index) shift right by 1
-                if to_index <= idx < from_index:
-                    updated.append(idx + 1)
-                else:
-                    updated.append(idx)
-
-        # Deduplicate while preserving order (in rare pathological cases)
-        seen = set()
-        deduped = []
-        for val in updated:
-            if val not in seen:
-                seen.add(val)
-                deduped.append(val)
-        self.recent_tab_order = deduped
+                return to_index
+            if low <= idx <= high:
+                return idx + delta
+            return idx
+
+        # Single pass; OrderedDict keys are unique, so duplicates produced in
+        # rare pathological cases collapse onto their first occurrence.
+        self.recent_tab_order = OrderedDict((shift(idx), None) for idx in self.recent_tab_order)
 
     # ---- Copy/Cut/Paste ----
     def copy_selection(self, cut: bool = False):
@@ -1238,7 +1285,24 @@ class MainWindow(QMainWindow):
         selected = current_tab.file_list.get_selected_items()
         if not selected:
             return
-        ClipboardManager.set_files(selected, operation='cut' if cut else 'copy')
+        operation = 'cut' if cut else 'copy'
+        self._clipboard_generation += 1
+        if len(selected) < self.ASYNC_CLIPBOARD_THRESHOLD:
+            ClipboardManager.set_files(selected, operation=operation)
+            return
+
+        # Large selection: serialize in a worker, set the clipboard on the GUI thread
+        generation = self._clipboard_generation
+
+        def build():
+            payload = ClipboardManager.build_payload(selected, operation)
+            self._clipboard_payload_ready.emit(generation, payload)
+
+        QThreadPool.globalInstance().start(build)
+
+    def _apply_clipboard_payload(self, generation: int, payload):
+        if generation == self._clipboard_generation:
+            ClipboardManager.set_payload(payload)
 
     def paste_into_current(self):
         current_tab = self.get_current_tab()
@@ -1260,11 +1324,10 @@ class MainWindow(QMainWindow):
             clip.paths,
             dest_dir,
             move=move,
-            conflict_callback=self._conflict_handler
+            conflict_callback=self._new_conflict_handler()
         )
         # Debounced refresh trigger on progress + on finish (final state)
-        task.file_progress.connect(self._schedule_refresh)
-        task.finished.connect(lambda *_: self._schedule_refresh(""))
+        self._refresh_on_task_progress(task)
         self.transfer_panel.setVisible(True)
 
     def handle_drop_operation(self, paths: List[str], destination_dir: str, move: bool):
@@ -1291,10 +1354,9 @@ class MainWindow(QMainWindow):
             normalized,
             destination_dir,
             move=move,
-            conflict_callback=self._conflict_handler
+            conflict_callback=self._new_conflict_handler()
         )
-        task.file_progress.connect(self._schedule_refresh)
-        task.finished.connect(lambda *_: self._schedule_refresh(""))
+        self._refresh_on_task_progress(task)
         self.transfer_panel.setVisible(True)
 
     def handle_drop_download(self, urls: List[str], destination_dir: str):
@@ -1304,12 +1366,32 @@ class MainWindow(QMainWindow):
         task = self.transfer_manager.start_download(
             urls,
             destination_dir,
-            conflict_callback=self._conflict_handler
+            conflict_callback=self._new_conflict_handler()
         )
-        task.file_progress.connect(self._schedule_refresh)
-        task.finished.connect(lambda *_: self._schedule_refresh(""))
+        self._refresh_on_task_progress(task)
         self.transfer_panel.setVisible(True)
 
+    def _new_conflict_handler(self):
+        """Return a conflict callback for a single transfer.
+
+        Once the user picks an "apply to all" decision, it is reused for the
+        remaining conflicts of that transfer without a round-trip to the GUI
+        thread. Rename decisions keep only the strategy; the worker suggests
+        a fresh name per conflict.
+        """
+        apply_all_holder = {}
+
+        def handler(existing, source):
+            cached = apply_all_holder.get('d')
+            if cached is not None:
+                return cached
+            decision = self._conflict_handler(existing, source)
+            if decision.apply_all and decision.action in ('overwrite', 'skip', 'rename'):
+                apply_all_holder['d'] = ConflictDecision(decision.action, apply_all=True)
+            return decision
+
+        return handler
+
     def _conflict_handler(self, existing, source):
         """Called in worker thread: synchronously obtain a ConflictDecision via GUI thread signal."""
         import threading
@@ -1331,8 +1413,7 @@ class MainWindow(QMainWindow):
         return result_holder.get('d', ConflictDecision('skip'))
 
     def _show_conflict_dialog(self, existing, source, complete_cb):
-        from ui.conflict_dialog import ConflictDialog
-        dlg = ConflictDialog(existing.name, self, source_path=source, existing_path=existing)
+        dlg = self._get_conflict_dialog_class()(existing.name, self, source_path=source, existing_path=existing)
         dlg.exec()
         if dlg.decision == 'overwrite':
             complete_cb(ConflictDecision('overwrite', apply_all=dlg.apply_all))
@@ -1354,17 +1435,24 @@ class MainWindow(QMainWindow):
         complete_cb(ConflictDecision('skip'))
 
     def _on_task_added(self, task):
+        self._hide_panel_timer.stop()
         self.transfer_panel.setVisible(True)
         self.transfer_panel.add_task(task)
-        task.finished.connect(lambda *_: self._maybe_hide_panel())
 
-    def _maybe_hide_panel(self):
+    def _hide_transfer_panel(self):
         if not self.transfer_manager.active_tasks():
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(500, lambda: self.transfer_panel.setVisible(False) if not self.transfer_manager.active_tasks() else None)
+            self.transfer_panel.setVisible(False)
 
     # ---- Debounced UI refresh helpers ----
-    def _schedule_refresh(self, _path: str):
+    def _refresh_on_task_progress(self, task):
+        # Plain method references: no per-task closures retaining self
+        task.file_progress.connect(self._schedule_refresh)
+        task.finished.connect(self._on_any_task_finished)
+
+    def _on_any_task_finished(self, *_args):
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, *_args):
         # Only schedule once per interval
         if not self._refresh_timer.isActive():
             self._refresh_timer.start()
@@ -1383,6 +1471,8 @@ class MainWindow(QMainWindow):
     def save_settings(self):
         """Save window settings"""
         self.settings.set("window_geometry", self.saveGeometry())
+        # Don't leave the write to the debounce timer, the app may be exiting
+        self.settings.save_settings()
 
     def closeEvent(self, a0):  # type: ignore[override]
         """Handle window close event and persist settings."""
@@ -3,22 +3,81 @@ Path navigation widget - displays path as clickable buttons
 """
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, QLineEdit,
                              QSizePolicy, QCompleter)
-from PyQt6.QtCore import pyqtSignal, Qt, QDir
+from PyQt6.QtCore import pyqtSignal, Qt, QDir, QTimer, QThreadPool
 from PyQt6.QtGui import QKeyEvent, QFileSystemModel
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+import os
+
+from core.file_operations import is_on_network_mount
+
+
+def _resolve_existing(path: str) -> Optional[Path]:
+    """Resolve path, returning None if it does not exist or can't be checked"""
+    try:
+        resolved = Path(path).resolve()
+        return resolved if resolved.exists() else None
+    except OSError:
+        # e.g. EACCES on a parent directory
+        return None
 
 class PathNavigator(QWidget):
     """Widget that displays current path as clickable buttons or text input"""
 
     path_changed = pyqtSignal(str)
     edit_mode_exited = pyqtSignal()
+    # Result of a background path check: (generation, resolved path or None)
+    _path_check_finished = pyqtSignal(int, object)
+
+    # Filesystem model shared by the completers of all navigators, so there
+    # is one watcher/worker thread instead of one per instance
+    _fs_model: QFileSystemModel | None = None
+
+    # Applied once to the button container; the pathRole selectors style
+    # the segment buttons inside it
+    _SEGMENT_STYLESHEET = """
+        QPushButton {
+            border: 1px solid palette(mid);
+            padding: 4px 8px;
+            margin: 0px;
+        }
+        QPushButton[pathRole="segment"] {
+            background-color: palette(button);
+        }
+        QPushButton[pathRole="segment"]:hover {
+            background-color: palette(light);
+            border: 1px solid palette(highlight);
+        }
+        QPushButton[pathRole="segment"]:pressed {
+            background-color: palette(midlight);
+        }
+        QPushButton[pathRole="segment"]:focus {
+            border: 1px solid palette(highlight);
+            background-color: palette(light);
+            outline: none;
+        }
+        /* Current (last) path segment styling */
+        QPushButton[pathRole="current"] {
+            font-weight: bold;
+            background-color: palette(window);
+            color: palette(windowText);
+        }
+        QPushButton[pathRole="current"]:hover {
+            /* Keep it stable on hover so it feels selected */
+            background-color: palette(window);
+        }
+        QPushButton[pathRole="current"]:pressed {
+            background-color: palette(window);
+        }
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_path = Path.home()
         self.edit_mode = False
         self._pending_selection_names: List[str] = []
+        # (button, full path) for each displayed path segment, root first
+        self._segment_buttons: List[Tuple[QPushButton, str]] = []
 
         self.setup_ui()
         self.update_path_display()
@@ -34,12 +93,14 @@ class PathNavigator(QWidget):
         self.path_edit.setVisible(False)
         self.path_edit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.path_edit.returnPressed.connect(self.confirm_path_edit)
+        # Bumped whenever the typed path changes, so stale background
+        # existence checks are ignored
+        self._path_check_generation = 0
+        self._path_check_finished.connect(self._on_path_check_finished)
 
         # Setup autocomplete for path input
         self.completer = QCompleter()
-        self.fs_model = QFileSystemModel()
-        self.fs_model.setRootPath("")
-        self.fs_model.setFilter(QDir.Filter.Dirs | QDir.Filter.NoDotAndDotDot)
+        self.fs_model = self._shared_fs_model()
         self.completer.setModel(self.fs_model)
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
         self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
@@ -52,6 +113,14 @@ class PathNavigator(QWidget):
         self._updating_from_completer = False
         self.path_edit.textChanged.connect(self.update_completer)
 
+        # Debounce completer directory fetches so a burst of keystrokes
+        # results in a single directory read
+        self._pending_completer_text = ""
+        self._completer_timer = QTimer(self)
+        self._completer_timer.setSingleShot(True)
+        self._completer_timer.setInterval(120)  # ms
+        self._completer_timer.timeout.connect(self._do_update_completer)
+
         self._layout.addWidget(self.path_edit, 1)  # stretch factor of 1 to fill space
 
         # Container for path buttons
@@ -59,33 +128,73 @@ class PathNavigator(QWidget):
         self.button_layout = QHBoxLayout(self.button_container)
         self.button_layout.setContentsMargins(0, 0, 0, 0)
         self.button_layout.setSpacing(2)
+        self.button_container.setStyleSheet(PathNavigator._SEGMENT_STYLESHEET)
         self._layout.addWidget(self.button_container)
 
         # Stretch to push buttons to left
         self._layout.addStretch()
 
-    def set_path(self, path):
-        """Set the current path and update display"""
-        self.current_path = Path(path).resolve()
+    @classmethod
+    def _shared_fs_model(cls) -> QFileSystemModel:
+        """Return the directory model shared by all navigators, creating it on first use"""
+        if PathNavigator._fs_model is None:
+            model = QFileSystemModel()
+            model.setRootPath("")
+            model.setFilter(QDir.Filter.Dirs | QDir.Filter.NoDotAndDotDot)
+            PathNavigator._fs_model = model
+        return PathNavigator._fs_model
+
+    @classmethod
+    def warm_completer_cache(cls, path) -> None:
+        """Fetch a directory into the shared completer model ahead of first use"""
+        model = cls._shared_fs_model()
+        index = model.index(str(path))
+        if index.isValid():
+            model.fetchMore(index)
+
+    def set_path(self, path, already_resolved: bool = False):
+        """Set the current path and update display.
+
+        Pass already_resolved=True for paths built from an already resolved
+        path (e.g. segment buttons) to skip the stat()/symlink walk of resolve().
+        """
+        self.current_path = Path(path) if already_resolved else Path(path).resolve()
         self.update_path_display()
 
     def update_path_display(self):
-        """Update the path button display"""
-        # Clear existing buttons
-        for i in reversed(range(self.button_layout.count())):
-            item = self.button_layout.itemAt(i)
-            child = item.widget() if item else None
-            if child:
-                child.deleteLater()
-
-        # Create buttons for each path component
+        """Update the path button display.
+
+        Buttons for the common prefix of the old and new path are reused;
+        only the differing tail is destroyed and rebuilt.
+        """
         parts = self.current_path.parts
+        full_paths = []
         current_path_parts = []
-
-        total_parts = len(parts)
-        for idx, part in enumerate(parts):
+        for part in parts:
             current_path_parts.append(part)
-            button_path = Path(*current_path_parts)
+            full_paths.append(str(Path(*current_path_parts)))
+
+        # Find the first segment whose full path no longer matches
+        keep = 0
+        for (_, full_path), new_full_path in zip(self._segment_buttons, full_paths):
+            if full_path != new_full_path:
+                break
+            keep += 1
+
+        # Suppress intermediate relayouts/repaints while the tail is swapped
+        self.button_container.setUpdatesEnabled(False)
+        self.button_layout.setEnabled(False)
+
+        # Drop the stale tail
+        for button, _ in self._segment_buttons[keep:]:
+            button.hide()
+            self.button_layout.removeWidget(button)
+            button.deleteLater()
+        del self._segment_buttons[keep:]
+
+        # Create buttons for the new path components
+        for idx in range(keep, len(parts)):
+            part = parts[idx]
 
             # Special handling for root
             if part == '/':
@@ -96,62 +205,45 @@ class PathNavigator(QWidget):
             button = QPushButton(button_text)
             button.setFlat(True)
             button.setProperty("pathRole", "segment")
-            button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid palette(mid);
-                    padding: 4px 8px;
-                    margin: 0px;
-                }
-                QPushButton[pathRole="segment"] {
-                    background-color: palette(button);
-                }
-                QPushButton[pathRole="segment"]:hover {
-                    background-color: palette(light);
-                    border: 1px solid palette(highlight);
-                }
-                QPushButton[pathRole="segment"]:pressed {
-                    background-color: palette(midlight);
-                }
-                QPushButton[pathRole="segment"]:focus {
-                    border: 1px solid palette(highlight);
-                    background-color: palette(light);
-                    outline: none;
-                }
-                /* Current (last) path segment styling */
-                QPushButton[pathRole="current"] {
-                    font-weight: bold;
-                    background-color: palette(window);
-                    color: palette(windowText);
-                }
-                QPushButton[pathRole="current"]:hover {
-                    /* Keep it stable on hover so it feels selected */
-                    background-color: palette(window);
-                }
-                QPushButton[pathRole="current"]:pressed {
-                    background-color: palette(window);
-                }
-            """)
-
-            # Store the full path for this button
-            is_last = (idx == total_parts - 1)
-            if is_last:
-                button.setProperty("pathRole", "current")
-                # Prevent navigation while leaving the button enabled (no-op)
-                button.clicked.connect(lambda checked: None)
-            else:
-                next_part = parts[idx + 1] if idx + 1 < total_parts else None
-                button.clicked.connect(
-                    lambda checked=False, p=str(button_path), child=next_part: self.navigate_to_path(p, child)
-                )
+            button.setProperty("fullPath", full_paths[idx])
+            button.clicked.connect(self._on_segment_clicked)
 
             self.button_layout.addWidget(button)
+            self._segment_buttons.append((button, full_paths[idx]))
+
+        # Only the last segment is styled as "current"; the others remember
+        # which child to select when navigating back up through them
+        last_idx = len(self._segment_buttons) - 1
+        for idx, (button, _) in enumerate(self._segment_buttons):
+            button.setProperty("childHint", parts[idx + 1] if idx < last_idx else "")
+            role = "current" if idx == last_idx else "segment"
+            if button.property("pathRole") != role:
+                button.setProperty("pathRole", role)
+                button.style().unpolish(button)
+                button.style().polish(button)
+
+        # Single relayout and repaint for the whole update
+        self.button_layout.setEnabled(True)
+        self.button_container.setUpdatesEnabled(True)
+        self.button_container.update()
+
+    def _on_segment_clicked(self, checked=False):
+        """Navigate to the clicked segment's path, selecting the child we came from."""
+        button = self.sender()
+        # The current (last) segment is a no-op
+        if button is None or button.property("pathRole") == "current":
+            return
+        self.navigate_to_path(button.property("fullPath"), button.property("childHint") or None)
 
     def navigate_to_path(self, path, select_child=None):
-        """Navigate to the specified path and remember which child to select."""
+        """Navigate to a segment path and remember which child to select.
+
+        The path must be a prefix of the (resolved) current path.
+        """
         self._pending_selection_names = []
         if select_child:
             self._pending_selection_names.append(str(select_child))
-        self.set_path(path)
+        self.set_path(path, already_resolved=True)
         self.path_changed.emit(str(self.current_path))
 
     def take_selection_hints(self) -> List[str]:
@@ -161,10 +253,21 @@ class PathNavigator(QWidget):
         return hints
 
     def update_completer(self, text):
-        """Update completer based on current text"""
+        """Schedule a completer update for the current text (debounced)"""
+        self._path_check_generation += 1
+        self._set_path_edit_state(None)
         if not text or self._updating_from_completer:
             return
 
+        self._pending_completer_text = text
+        self._completer_timer.start()
+
+    def _do_update_completer(self):
+        """Fetch the directory the pending completer text refers to"""
+        text = self._pending_completer_text
+        if not text:
+            return
+
         # Get the parent directory of the current text
         path = Path(text)
         if path.is_dir() and text.endswith('/'):
@@ -200,19 +303,57 @@ class PathNavigator(QWidget):
 
     def exit_edit_mode(self):
         """Exit text edit mode (Esc)"""
+        self._path_check_generation += 1
+        self._set_path_edit_state(None)
         self.edit_mode = False
         self.path_edit.setVisible(False)
         self.button_container.setVisible(True)
         self.edit_mode_exited.emit()
 
     def confirm_path_edit(self):
-        """Confirm the path edit and navigate"""
+        """Confirm the path edit and navigate.
+
+        Paths on network/automount filesystems are checked in a worker so
+        a slow stat() doesn't block the UI; edit mode stays open meanwhile.
+        """
         new_path = self.path_edit.text().strip()
-        if new_path and Path(new_path).exists():
-            self.set_path(new_path)
-            self.path_changed.emit(str(self.current_path))
+        if not new_path:
+            self.exit_edit_mode()
+            return
+
+        self._path_check_generation += 1
+        generation = self._path_check_generation
+        if not is_on_network_mount(os.path.abspath(new_path)):
+            self._on_path_check_finished(generation, _resolve_existing(new_path))
+            return
+
+        self._set_path_edit_state("pending")
+
+        def check():
+            self._path_check_finished.emit(generation, _resolve_existing(new_path))
+
+        QThreadPool.globalInstance().start(check)
+
+    def _on_path_check_finished(self, generation: int, resolved):
+        """Navigate to a checked path, or flag it as invalid"""
+        if generation != self._path_check_generation:
+            return  # The user typed something else meanwhile
+        if resolved is None:
+            self._set_path_edit_state("invalid")
+            return
+        self.set_path(resolved, already_resolved=True)
+        self.path_changed.emit(str(self.current_path))
         self.exit_edit_mode()
 
+    def _set_path_edit_state(self, state: Optional[str]):
+        """Style the path edit as pending, invalid or normal (None)"""
+        if state == "pending":
+            self.path_edit.setStyleSheet("QLineEdit { color: palette(mid); }")
+        elif state == "invalid":
+            self.path_edit.setStyleSheet("QLineEdit { background-color: #ffd6d6; }")
+        elif self.path_edit.styleSheet():
+            self.path_edit.setStyleSheet("")
+
     def eventFilter(self, obj, event):
         """Handle events for path_edit, specifically Tab key for autocomplete"""
         if obj == self.path_edit and event.type() == event.Type.KeyPress:
@@ -1,11 +1,20 @@
 """
 Places dropdown widget for quick navigation to standard directories
 """
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QToolButton, QMenu
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QIcon
 from core.places_manager import PlacesManager
 
+
+@lru_cache(maxsize=128)
+def _themed_icon(name: str) -> QIcon:
+    """Return QIcon.fromTheme(name), memoized so each theme name is looked up once"""
+    return QIcon.fromTheme(name)
+
+
 class PlacesButton(QToolButton):
     """Button that shows a dropdown with standard places using XDG standards"""
 
@@ -15,24 +24,31 @@ class PlacesButton(QToolButton):
         super().__init__(parent)
 
         # Try different icon options - prefer sidebar/navigation icons
-        icon = QIcon.fromTheme("view-sidetree")  # Sidebar icon (common in KDE/Plasma)
+        icon = _themed_icon("view-sidetree")  # Sidebar icon (common in KDE/Plasma)
         if icon.isNull():
-            icon = QIcon.fromTheme("folder-home")  # Home folder icon
+            icon = _themed_icon("folder-home")  # Home folder icon
         if icon.isNull():
-            icon = QIcon.fromTheme("go-home")  # Navigation home icon
+            icon = _themed_icon("go-home")  # Navigation home icon
         if icon.isNull():
-            icon = QIcon.fromTheme("user-home")  # User home icon
+            icon = _themed_icon("user-home")  # User home icon
         if icon.isNull():
-            icon = QIcon.fromTheme("folder")  # Generic folder fallback
+            icon = _themed_icon("folder")  # Generic folder fallback
 
         self.setIcon(icon)
         self.setToolTip("Places")
         # Use InstantPopup so clicking anywhere opens the menu
         self.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
         self.places_manager = PlacesManager()
+        # Signature of the places the current menu was built from
+        self._places_signature = None
 
         self.setup_menu()
 
+    @staticmethod
+    def _signature(places):
+        """Content signature of a list of places, used to detect changes"""
+        return tuple((p.name, p.path, p.icon, p.builtin) for p in places)
+
     def setup_menu(self):
         """Setup the places menu with XDG directories and bookmarks"""
         menu = QMenu(self)
@@ -53,15 +69,20 @@ class PlacesButton(QToolButton):
 
             # Add icon if available
             if place.icon:
-                icon = QIcon.fromTheme(place.icon)
+                icon = _themed_icon(place.icon)
                 if not icon.isNull():
                     action.setIcon(icon)
 
             action.triggered.connect(lambda checked, p=place.path: self.place_selected.emit(p))
 
         self.setMenu(menu)
+        self._places_signature = self._signature(places)
 
     def refresh_places(self):
         """Refresh the places menu (useful after adding/removing bookmarks)"""
         self.places_manager.clear_cache()
+        places = self.places_manager.get_all_places()
+        # Keep the existing menu when nothing changed
+        if self._signature(places) == self._places_signature:
+            return
         self.setup_menu()
@@ -5,88 +5,216 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QTabWidget, QWidget, QFormLayout, QCheckBox,
                              QComboBox, QGroupBox, QPushButton, QTextEdit,
                              QGridLayout, QSpacerItem, QSizePolicy, QMessageBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QRunnable, QThreadPool, pyqtSignal, QObject, QTimer
 from PyQt6.QtGui import QMovie
-from core.file_operations import FileOperations
-from core.application_manager import ApplicationManager, DesktopApplication
+from core.file_operations import FileOperations, is_on_network_mount
+from core.application_manager import DesktopApplication, get_app_manager
 from pathlib import Path
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os
+import stat
 import subprocess
 import time
 
-class FolderSizeWorker(QObject):
-    """Worker that computes folder size and file count recursively with incremental updates.
+class FolderSizeSignals(QObject):
+    """Signals of FolderSizeWorker (QRunnable isn't a QObject).
 
     NOTE: Using `object` signal type instead of `int` because PyQt's `int` maps to
     C++ int (typically 32-bit). Large folders can exceed 2^31-1 bytes (>2GB) and
     would overflow, producing negative intermediate values in the UI. Emitting a
     Python object preserves the full arbitrary-precision integer size safely.
     """
-    # Use Python object for arbitrary large integers to avoid 32-bit overflow
-    progress = pyqtSignal(object)      # cumulative size in bytes (int)
-    done = pyqtSignal(object)          # final size in bytes (int)
-    file_count_progress = pyqtSignal(int)  # cumulative file count
-    file_count_done = pyqtSignal(int)      # final file count
+    # Use Python object for arbitrary large integers to avoid 32-bit overflow.
+    # Size and file count travel together: one queued signal per update
+    progress = pyqtSignal(object, int)  # cumulative size in bytes, file count
+    done = pyqtSignal(object, int)      # final size in bytes, file count
+
+
+class FolderSizeWorker(QRunnable):
+    """Worker that computes folder size and file count recursively with incremental updates.
+
+    Runs on the global thread pool; results are reported through `signals`.
+    """
 
     def __init__(self, path: str):
         super().__init__()
         self.path = path
+        self.signals = FolderSizeSignals()
         self._stop = False
+        # The owner keeps a reference to call stop(); don't let the pool delete it
+        self.setAutoDelete(False)
 
     def stop(self):
         self._stop = True
 
+    # Read the clock only every this many files
+    TIME_CHECK_INTERVAL = 1024
+    # Emit progress once this many bytes were added and the minimum interval
+    # passed, or unconditionally after the maximum interval (so trees of many
+    # small files still show their count moving)
+    PROGRESS_BYTES_STEP = 64 << 20
+    PROGRESS_MIN_INTERVAL = 0.1
+    PROGRESS_MAX_INTERVAL = 1.0
+    # Directory names never descended into (btrfs/snapper snapshots hold
+    # copies of the whole tree)
+    SKIP_NAMES = frozenset({'.snapshots'})
+    # Directories read at once on network filesystems, where each read mostly
+    # waits on the server
+    NETWORK_SCAN_THREADS = 8
+
     def run(self):
         total = 0
         file_count = 0
-        last_emit = 0.0
+        last_emit = float('-inf')
+        last_emit_bytes = 0
+        # Check the clock on the first file so progress shows up early
+        until_time_check = 1
         try:
-            for root, dirs, files in os.walk(self.path, followlinks=False):
-                if self._stop:
-                    break
-                # Optionally prune dirs if needed (skip large mounts, etc.)
-                for f in files:
-                    if self._stop:
-                        break
-                    fp = os.path.join(root, f)
-                    try:
-                        if not os.path.islink(fp):
-                            total += os.path.getsize(fp)
+            # Stay on the folder's filesystem: this skips /proc, /sys, /dev and
+            # network or automounted filesystems below the folder
+            root_dev = os.stat(self.path).st_dev
+            if is_on_network_mount(os.path.abspath(self.path)):
+                total, file_count = self._walk_parallel(root_dev)
+                self.signals.done.emit(total, file_count)
+                return
+            # Iterative scandir walk: one lstat() per file or directory, none
+            # for symlinks
+            pending = deque([self.path])
+            while pending and not self._stop:
+                # One handler per directory: failing to open or read it
+                # skips just that directory
+                try:
+                    with os.scandir(pending.pop()) as it:
+                        for entry in it:
+                            # The type predicates come from readdir (d_type),
+                            # so symlinks are skipped without any stat() call
+                            if entry.is_symlink():
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name in self.SKIP_NAMES:
+                                    continue
+                                try:
+                                    if entry.stat(follow_symlinks=False).st_dev == root_dev:
+                                        pending.append(entry.path)
+                                except OSError:
+                                    pass
+                                continue
+                            try:
+                                total += entry.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                continue
                             file_count += 1
-                    except OSError:
-                        continue
-                    now = time.time()
-                    # Throttle UI updates to ~20/sec
-                    if now - last_emit >= 0.05:
-                        last_emit = now
-                        self.progress.emit(total)
-                        self.file_count_progress.emit(file_count)
+
+                            until_time_check -= 1
+                            if until_time_check <= 0:
+                                until_time_check = self.TIME_CHECK_INTERVAL
+                                # Stop requests are polled per directory and
+                                # with the clock, not per entry
+                                if self._stop:
+                                    break
+                                now = time.monotonic()
+                                elapsed = now - last_emit
+                                if (elapsed >= self.PROGRESS_MAX_INTERVAL
+                                        or (elapsed >= self.PROGRESS_MIN_INTERVAL
+                                            and total - last_emit_bytes >= self.PROGRESS_BYTES_STEP)):
+                                    last_emit = now
+                                    last_emit_bytes = total
+                                    self.signals.progress.emit(total, file_count)
+                except OSError:
+                    continue
             # Emit final values
-            self.done.emit(total)
-            self.file_count_done.emit(file_count)
+            self.signals.done.emit(total, file_count)
         except Exception:
             # Still emit what we have to avoid spinner hanging
-            self.done.emit(total)
-            self.file_count_done.emit(file_count)
+            self.signals.done.emit(total, file_count)
+
+    def _walk_parallel(self, root_dev: int):
+        """Walk with up to NETWORK_SCAN_THREADS directories read concurrently.
+
+        Directories are scanned on a private thread pool; totals are only
+        added up on this thread, which also emits progress.
+        """
+        total = 0
+        file_count = 0
+        last_emit = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.NETWORK_SCAN_THREADS) as pool:
+            pending = {pool.submit(self._scan_dir, self.path, root_dev)}
+            while pending and not self._stop:
+                done, pending = wait(pending, timeout=self.PROGRESS_MAX_INTERVAL,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    size, count, subdirs = future.result()
+                    total += size
+                    file_count += count
+                    for subdir in subdirs:
+                        pending.add(pool.submit(self._scan_dir, subdir, root_dev))
+                now = time.monotonic()
+                if now - last_emit >= self.PROGRESS_MIN_INTERVAL:
+                    last_emit = now
+                    self.signals.progress.emit(total, file_count)
+            for future in pending:
+                future.cancel()
+        return total, file_count
+
+    def _scan_dir(self, path: str, root_dev: int):
+        """Size and count of the files directly in path, and its subdirectories"""
+        size = 0
+        count = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # Same rules as the serial walk in run()
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in self.SKIP_NAMES:
+                            continue
+                        try:
+                            if entry.stat(follow_symlinks=False).st_dev == root_dev:
+                                subdirs.append(entry.path)
+                        except OSError:
+                            pass
+                        continue
+                    try:
+                        size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    count += 1
+        except OSError:
+            pass
+        return size, count, subdirs
 
 class PropertiesDialog(QDialog):
     """Dialog showing file/folder properties"""
 
+    # Permission grid rows: (label, file_info prefix, mode bit shift)
+    _PERM_ROWS = (("Owner:", "owner", 6), ("Group:", "group", 3), ("Others:", "other", 0))
+    # Permission grid columns: (header, file_info suffix, mode bit)
+    _PERM_COLUMNS = (("Read", "read", 4), ("Write", "write", 2), ("Execute", "execute", 1))
+
+    # Spinner QMovie shared by all dialogs (False if spinner.gif is unusable)
+    # and the number of dialogs currently showing it
+    _spinner = None
+    _spinner_users = 0
+
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
         self.file_path = file_path
         self.file_info = FileOperations.get_file_info(file_path)
-        self.app_manager = ApplicationManager()
-        if self.file_info and self.file_info.get('is_file'):
-            self.file_info['mime_type'] = self.app_manager.get_mime_type(self.file_path)
-        else:
-            self.file_info['mime_type'] = 'inode/directory'
+        self.app_manager = get_app_manager()
 
         self.available_applications = []
+        self._apps_by_name = {}
+        # MIME type -> ranked applications, reused when the combo is filled
+        # again; dropped when a new default changes the ranking
+        self._ranked_cache: dict[str, list[DesktopApplication]] = {}
         self.default_application = None
+        # The Open With combo is filled after the dialog is first shown
+        self._open_with_populated = False
 
         # Folder size async members
-        self.size_thread: QThread | None = None
         self.folder_size_worker: FolderSizeWorker | None = None
         self._last_folder_size = 0
         self._last_file_count = 0
@@ -94,8 +222,10 @@ class PropertiesDialog(QDialog):
         self.size_spinner_label: QLabel | None = None
         self.file_count_label: QLabel | None = None
         self.file_count_spinner_label: QLabel | None = None
+        # Shared spinner (see _shared_spinner), None when unavailable or done;
+        # it only runs once the dialog is shown
         self.spinner_movie: QMovie | None = None
-        self.file_count_spinner_movie: QMovie | None = None
+        self._spinner_started = False
 
         if not self.file_info:
             self.close()
@@ -159,9 +289,15 @@ class PropertiesDialog(QDialog):
             file_type = "File"
         info_layout.addRow("Type:", QLabel(file_type))
 
-        # Mime type
-        if self.file_info.get('mime_type'):
-            info_layout.addRow("MIME type:", QLabel(self.file_info['mime_type']))
+        # Mime type: sniffing a file may run xdg-mime, so files get a
+        # placeholder filled in after the dialog is shown (see showEvent)
+        if self.file_info.get('is_file'):
+            self.file_info['mime_type'] = None
+            self.mime_type_label = QLabel("…")
+        else:
+            self.file_info['mime_type'] = 'inode/directory'
+            self.mime_type_label = QLabel(self.file_info['mime_type'])
+        info_layout.addRow("MIME type:", self.mime_type_label)
 
         # Location
         location = str(Path(self.file_path).parent)
@@ -176,17 +312,8 @@ class PropertiesDialog(QDialog):
 
             self.size_value_label = QLabel("Calculating...")
             self.size_spinner_label = QLabel()
-            # Try loading spinner.gif placed alongside this file
-            spinner_path = os.path.join(os.path.dirname(__file__), "spinner.gif")
-            if os.path.exists(spinner_path):
-                self.spinner_movie = QMovie(spinner_path)
-                if self.spinner_movie.isValid():
-                    self.size_spinner_label.setMovie(self.spinner_movie)
-                    self.spinner_movie.start()
-                else:
-                    self.size_spinner_label.setText("...")
-            else:
-                self.size_spinner_label.setText("...")
+            self.spinner_movie = self._shared_spinner()
+            self._set_spinner(self.size_spinner_label)
             size_row_layout.addWidget(self.size_value_label)
             size_row_layout.addWidget(self.size_spinner_label)
             size_row_layout.addStretch()
@@ -199,15 +326,7 @@ class PropertiesDialog(QDialog):
 
             self.file_count_label = QLabel("Calculating...")
             self.file_count_spinner_label = QLabel()
-            if os.path.exists(spinner_path):
-                self.file_count_spinner_movie = QMovie(spinner_path)
-                if self.file_count_spinner_movie.isValid():
-                    self.file_count_spinner_label.setMovie(self.file_count_spinner_movie)
-                    self.file_count_spinner_movie.start()
-                else:
-                    self.file_count_spinner_label.setText("...")
-            else:
-                self.file_count_spinner_label.setText("...")
+            self._set_spinner(self.file_count_spinner_label)
             file_count_row_layout.addWidget(self.file_count_label)
             file_count_row_layout.addWidget(self.file_count_spinner_label)
             file_count_row_layout.addStretch()
@@ -221,8 +340,9 @@ class PropertiesDialog(QDialog):
             info_layout.addRow("Size:", self.size_value_label)
 
         # Dates
-        created_text = self.file_info['created'].strftime("%Y-%m-%d %H:%M:%S")
-        modified_text = self.file_info['modified'].strftime("%Y-%m-%d %H:%M:%S")
+        # isoformat() gives "YYYY-MM-DD HH:MM:SS" without parsing a format string
+        created_text = self.file_info['created'].isoformat(' ', 'seconds')
+        modified_text = self.file_info['modified'].isoformat(' ', 'seconds')
 
         info_layout.addRow("Created:", QLabel(created_text))
         info_layout.addRow("Modified:", QLabel(modified_text))
@@ -236,7 +356,10 @@ class PropertiesDialog(QDialog):
 
             self.open_with_combo = QComboBox()
             self.open_with_combo.currentTextChanged.connect(self.on_application_changed)
-            self.populate_open_with_applications()
+            # Scanning .desktop files is slow; show a placeholder until the
+            # dialog has painted (see showEvent)
+            self.open_with_combo.addItem("Loading…")
+            self.open_with_combo.setEnabled(False)
             open_with_layout.addRow("Default application:", self.open_with_combo)
 
             layout.addWidget(open_with_group)
@@ -246,61 +369,82 @@ class PropertiesDialog(QDialog):
 
         tab_widget.addTab(general_widget, "General")
 
+    @classmethod
+    def _shared_spinner(cls) -> QMovie | None:
+        """Return the spinner shared by all dialogs, decoded once per process"""
+        if PropertiesDialog._spinner is None:
+            # Try loading spinner.gif placed alongside this file
+            spinner_path = os.path.join(os.path.dirname(__file__), "spinner.gif")
+            movie = QMovie(spinner_path) if os.path.exists(spinner_path) else None
+            PropertiesDialog._spinner = movie if movie is not None and movie.isValid() else False
+        return PropertiesDialog._spinner if PropertiesDialog._spinner is not False else None
+
+    def _start_spinner(self):
+        """Count this dialog as a spinner user; it runs while any dialog uses it"""
+        if self.spinner_movie is None or self._spinner_started:
+            return
+        self._spinner_started = True
+        PropertiesDialog._spinner_users += 1
+        if PropertiesDialog._spinner_users == 1:
+            self.spinner_movie.start()
+
+    def _release_spinner(self):
+        """Drop this dialog's use of the shared spinner, stopping it when unused"""
+        movie = self.spinner_movie
+        self.spinner_movie = None
+        if movie is None or not self._spinner_started:
+            return
+        self._spinner_started = False
+        PropertiesDialog._spinner_users -= 1
+        if PropertiesDialog._spinner_users == 0:
+            movie.stop()
+
+    def _set_spinner(self, label: QLabel):
+        """Show the spinner in label, or a text placeholder without one"""
+        if self.spinner_movie is not None:
+            label.setMovie(self.spinner_movie)
+        else:
+            label.setText("...")
+
     def start_folder_size_calculation(self):
         """Start background recursive folder size computation."""
         if not self.file_info.get('is_dir'):
             return
-        # Safety: avoid duplicate threads
-        if self.size_thread and self.size_thread.isRunning():
+        # Safety: avoid duplicate workers
+        if self.folder_size_worker:
             return
 
         self.folder_size_worker = FolderSizeWorker(self.file_path)
-        self.size_thread = QThread(self)
-        self.folder_size_worker.moveToThread(self.size_thread)
-
-        self.size_thread.started.connect(self.folder_size_worker.run)
-        self.folder_size_worker.progress.connect(self.on_folder_size_progress)
-        self.folder_size_worker.done.connect(self.on_folder_size_done)
-        self.folder_size_worker.file_count_progress.connect(self.on_file_count_progress)
-        self.folder_size_worker.file_count_done.connect(self.on_file_count_done)
-        self.folder_size_worker.done.connect(lambda _: self.size_thread.quit())
-
-        # Ensure cleanup
-        self.size_thread.finished.connect(self.size_thread.deleteLater)
-        self.size_thread.start()
-
-    def on_folder_size_progress(self, total_bytes: int):
-        """Incremental update for folder size."""
+        signals = self.folder_size_worker.signals
+        signals.progress.connect(self.on_folder_scan_progress)
+        signals.done.connect(self.on_folder_scan_done)
+
+        # Pooled threads are reused across dialogs
+        QThreadPool.globalInstance().start(self.folder_size_worker)
+
+    def on_folder_scan_progress(self, total_bytes: int, count: int):
+        """Incremental update for folder size and file count."""
         self._last_folder_size = total_bytes
+        self._last_file_count = count
         if self.size_value_label:
             self.size_value_label.setText(FileOperations.format_size(total_bytes))
+        if self.file_count_label:
+            self.file_count_label.setText(f"{count:,}")
 
-    def on_folder_size_done(self, final_bytes: int):
-        """Finalize folder size display."""
+    def on_folder_scan_done(self, final_bytes: int, final_count: int):
+        """Finalize folder size and file count display."""
         self._last_folder_size = final_bytes
+        self._last_file_count = final_count
         if self.size_value_label:
             self.size_value_label.setText(FileOperations.format_size(final_bytes))
         if self.size_spinner_label:
             self.size_spinner_label.hide()
-        if self.spinner_movie:
-            self.spinner_movie.stop()
-
-    def on_file_count_progress(self, count: int):
-        """Incremental update for file count."""
-        self._last_file_count = count
-        if self.file_count_label:
-            self.file_count_label.setText(f"{count:,}")
-
-    def on_file_count_done(self, final_count: int):
-        """Finalize file count display."""
-        self._last_file_count = final_count
         if self.file_count_label:
             file_word = "file" if final_count == 1 else "files"
             self.file_count_label.setText(f"{final_count:,} {file_word}")
         if self.file_count_spinner_label:
             self.file_count_spinner_label.hide()
-        if self.file_count_spinner_movie:
-            self.file_count_spinner_movie.stop()
+        self._release_spinner()
 
     def create_permissions_tab(self, tab_widget):
         """Create the permissions tab"""
@@ -310,7 +454,8 @@ class PropertiesDialog(QDialog):
         # Permissions display
         perm_display_group = QGroupBox("Current Permissions")
         perm_display_layout = QFormLayout(perm_display_group)
-        perm_display_layout.addRow("Permissions:", QLabel(self.file_info['permissions']))
+        self._perm_display_label = QLabel(self.file_info['permissions'])
+        perm_display_layout.addRow("Permissions:", self._perm_display_label)
         layout.addWidget(perm_display_group)
 
         # Permissions grid
@@ -319,36 +464,20 @@ class PropertiesDialog(QDialog):
 
         # Headers
         perm_layout.addWidget(QLabel(""), 0, 0)
-        perm_layout.addWidget(QLabel("Read"), 0, 1)
-        perm_layout.addWidget(QLabel("Write"), 0, 2)
-        perm_layout.addWidget(QLabel("Execute"), 0, 3)
-
-        # Owner permissions
-        perm_layout.addWidget(QLabel("Owner:"), 1, 0)
-        self.owner_read_cb = QCheckBox()
-        self.owner_write_cb = QCheckBox()
-        self.owner_execute_cb = QCheckBox()
-        perm_layout.addWidget(self.owner_read_cb, 1, 1)
-        perm_layout.addWidget(self.owner_write_cb, 1, 2)
-        perm_layout.addWidget(self.owner_execute_cb, 1, 3)
-
-        # Group permissions
-        perm_layout.addWidget(QLabel("Group:"), 2, 0)
-        self.group_read_cb = QCheckBox()
-        self.group_write_cb = QCheckBox()
-        self.group_execute_cb = QCheckBox()
-        perm_layout.addWidget(self.group_read_cb, 2, 1)
-        perm_layout.addWidget(self.group_write_cb, 2, 2)
-        perm_layout.addWidget(self.group_execute_cb, 2, 3)
-
-        # Others permissions
-        perm_layout.addWidget(QLabel("Others:"), 3, 0)
-        self.other_read_cb = QCheckBox()
-        self.other_write_cb = QCheckBox()
-        self.other_execute_cb = QCheckBox()
-        perm_layout.addWidget(self.other_read_cb, 3, 1)
-        perm_layout.addWidget(self.other_write_cb, 3, 2)
-        perm_layout.addWidget(self.other_execute_cb, 3, 3)
+        for col, (header, _, _) in enumerate(self._PERM_COLUMNS, 1):
+            perm_layout.addWidget(QLabel(header), 0, col)
+
+        # One checkbox per class/permission, exposed as e.g. self.owner_read_cb.
+        # (file_info key, checkbox, mode bit), used to load and apply permissions
+        self._perm_table = []
+        for row, (label, prefix, shift) in enumerate(self._PERM_ROWS, 1):
+            perm_layout.addWidget(QLabel(label), row, 0)
+            for col, (_, suffix, bit) in enumerate(self._PERM_COLUMNS, 1):
+                key = f"{prefix}_{suffix}"
+                checkbox = QCheckBox()
+                setattr(self, f"{key}_cb", checkbox)
+                perm_layout.addWidget(checkbox, row, col)
+                self._perm_table.append((key, checkbox, bit << shift))
 
         layout.addWidget(perm_group)
 
@@ -365,33 +494,49 @@ class PropertiesDialog(QDialog):
     def load_data(self):
         """Load data into the dialog"""
         # Load permission checkboxes
-        if hasattr(self, 'owner_read_cb'):
-            self.owner_read_cb.setChecked(self.file_info['owner_read'])
-            self.owner_write_cb.setChecked(self.file_info['owner_write'])
-            self.owner_execute_cb.setChecked(self.file_info['owner_execute'])
-
-            self.group_read_cb.setChecked(self.file_info['group_read'])
-            self.group_write_cb.setChecked(self.file_info['group_write'])
-            self.group_execute_cb.setChecked(self.file_info['group_execute'])
+        for key, checkbox, _ in getattr(self, '_perm_table', ()):
+            checkbox.setChecked(self.file_info[key])
+
+    def showEvent(self, event):
+        """Start the spinner and the deferred MIME/Open With lookups once on screen"""
+        super().showEvent(event)
+        self._start_spinner()
+        if self.file_info.get('is_file') and not self._open_with_populated:
+            QTimer.singleShot(0, self.ensure_open_with_populated)
+
+    def ensure_open_with_populated(self):
+        """Populate the Open With combo if that hasn't happened yet"""
+        if not self._open_with_populated:
+            self.populate_open_with_applications()
 
-            self.other_read_cb.setChecked(self.file_info['other_read'])
-            self.other_write_cb.setChecked(self.file_info['other_write'])
-            self.other_execute_cb.setChecked(self.file_info['other_execute'])
+    def ensure_mime_type(self) -> str:
+        """Look up the MIME type on first use and show it"""
+        if self.file_info['mime_type'] is None:
+            self.file_info['mime_type'] = self.app_manager.get_mime_type(self.file_path)
+            self.mime_type_label.setText(self.file_info['mime_type'])
+        return self.file_info['mime_type']
 
     def populate_open_with_applications(self):
         """Populate the open with applications combo box"""
         if not self.file_info.get('is_file'):
             return
+        self._open_with_populated = True
         self.open_with_combo.clear()
+        self.open_with_combo.setEnabled(True)
 
         # Get default application
         self.default_application = self.app_manager.get_default_application(self.file_path)
 
         # Get ranked applications if available
-        try:
-            self.available_applications = self.app_manager.get_ranked_applications_for_file(self.file_path)
-        except AttributeError:
-            self.available_applications = self.app_manager.get_applications_for_file(self.file_path)
+        mime_type = self.ensure_mime_type()
+        if mime_type not in self._ranked_cache:
+            try:
+                self._ranked_cache[mime_type] = self.app_manager.get_ranked_applications_for_file(self.file_path)
+            except AttributeError:
+                self._ranked_cache[mime_type] = self.app_manager.get_applications_for_file(self.file_path)
+        self.available_applications = self._ranked_cache[mime_type]
+        # Combo text -> application; reversed so the first of duplicate names wins
+        self._apps_by_name = {app.name: app for app in reversed(self.available_applications)}
 
         if self.default_application:
             self.open_with_combo.addItem(f"{self.default_application.name} (default)")
@@ -409,36 +554,18 @@ class PropertiesDialog(QDialog):
         try:
             # Calculate new permission mode
             mode = 0
-
-            # Owner permissions
-            if self.owner_read_cb.isChecked():
-                mode |= 0o400
-            if self.owner_write_cb.isChecked():
-                mode |= 0o200
-            if self.owner_execute_cb.isChecked():
-                mode |= 0o100
-
-            # Group permissions
-            if self.group_read_cb.isChecked():
-                mode |= 0o040
-            if self.group_write_cb.isChecked():
-                mode |= 0o020
-            if self.group_execute_cb.isChecked():
-                mode |= 0o010
-
-            # Others permissions
-            if self.other_read_cb.isChecked():
-                mode |= 0o004
-            if self.other_write_cb.isChecked():
-                mode |= 0o002
-            if self.other_execute_cb.isChecked():
-                mode |= 0o001
+            for _, checkbox, bit in self._perm_table:
+                if checkbox.isChecked():
+                    mode |= bit
 
             # Apply permissions
             os.chmod(self.file_path, mode)
 
-            # Refresh file info
-            self.file_info = FileOperations.get_file_info(self.file_path)
+            # chmod replaces all permission bits (including setuid/setgid/
+            # sticky); keep the file type bits, no need to stat again
+            full_mode = stat.S_IFMT(self.file_info['mode']) | mode
+            self.file_info.update(FileOperations.permission_info(full_mode))
+            self._perm_display_label.setText(self.file_info['permissions'])
 
         except OSError as e:
             QMessageBox.warning(self, "Permission Error", f"Could not change permissions:\n{str(e)}")
@@ -451,16 +578,13 @@ class PropertiesDialog(QDialog):
         """Get the currently selected application from combo box"""
         if not self.file_info.get('is_file'):
             return None
+        self.ensure_open_with_populated()
         current_text = self.open_with_combo.currentText()
 
         if "(default)" in current_text and self.default_application:
             return self.default_application
 
-        for app in self.available_applications:
-            if app.name == current_text:
-                return app
-
-        return None
+        return self._apps_by_name.get(current_text)
 
     def apply_changes(self):
         """Apply the changes made in the Properties dialog"""
@@ -477,6 +601,8 @@ class PropertiesDialog(QDialog):
                     self, "Default Application Changed",
                     f"'{selected_app.name}' is now the default application for this file type."
                 )
+                # The system default is ranked first
+                self._ranked_cache.pop(self.ensure_mime_type(), None)
                 self.populate_open_with_applications()
             else:
                 QMessageBox.warning(
@@ -484,17 +610,21 @@ class PropertiesDialog(QDialog):
                     f"Could not set '{selected_app.name}' as the default application."
                 )
 
+    def done(self, result):
+        """Stop the background worker however the dialog is dismissed.
+
+        Close (accept), Esc (reject) and the window's close button all end
+        up here, so the walk doesn't keep holding a global pool thread.
+        """
+        self._stop_folder_scan()
+        super().done(result)
+
     def closeEvent(self, event):
         """Ensure background worker stops when dialog closes."""
+        self._stop_folder_scan()
+        super().closeEvent(event)
+
+    def _stop_folder_scan(self):
         if self.folder_size_worker:
             self.folder_size_worker.stop()
-        if self.size_thread:
-            try:
-                if self.size_thread.isRunning():
-                    # Gracefully ask thread to finish
-                    self.size_thread.quit()
-                    self.size_thread.wait(500)
-            except RuntimeError:
-                # Thread may have already been deleted
-                pass
-        super().closeEvent(event)
+        self._release_spinner()
@@ -27,8 +27,7 @@ def _selection_span(filename: str) -> tuple[int, int]:
     """
     if not filename:
         return 0, 0
-    search_from = 1 if filename.startswith('.') else 0
-    dot_index = filename.find('.', search_from)
+    dot_index = filename.find('.', 1 if filename[0] == '.' else 0)
     if dot_index == -1:
         return 0, len(filename)
     return 0, dot_index
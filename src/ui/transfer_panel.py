@@ -1,15 +1,46 @@
 """Panel showing active transfers."""
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QHBoxLayout, QLabel, QProgressBar, QPushButton, QSizePolicy
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QTimer, pyqtSignal
 from core.file_transfer import FileTransferTask
+from collections import deque
+from functools import lru_cache
 import time
 
 
+_SPEED_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
+
+
+def _fmt_bps(bps: float) -> str:
+    """Format a bytes-per-second speed in the largest fitting unit"""
+    v = float(bps)
+    unit = 0
+    while v >= 1024 and unit < len(_SPEED_UNITS) - 1:
+        v /= 1024
+        unit += 1
+    # Speeds that display the same share one cache entry
+    return _fmt_speed_tenths(round(v * 10), unit)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_speed_tenths(tenths: int, unit: int) -> str:
+    return f"{tenths / 10:.1f} {_SPEED_UNITS[unit]}"
+
+
 class TransferWidget(QFrame):
+    # The current task finished; old tasks of a reused widget don't emit it
+    transfer_finished = pyqtSignal()
+
+    # Progress can be reported thousands of times per second; the label and
+    # bar are refreshed at most this often
+    UI_UPDATE_INTERVAL_MS = 100
+    # Seconds of history used for the current speed and ETA
+    SPEED_WINDOW = 3.0
+
     def __init__(self, task: FileTransferTask, parent=None):
         super().__init__(parent)
-        self.task = task
+        self.task = None
         self._init()
+        self.reset(task)
 
     def _init(self):
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
@@ -23,22 +54,57 @@ class TransferWidget(QFrame):
         layout.addWidget(self.label, 2)
         layout.addWidget(self.progress, 5)
         layout.addWidget(self.btn_cancel, 0)
-        self.btn_cancel.clicked.connect(self.task.cancel)
-        self.task.progress_changed.connect(self._on_progress)
-        self.task.finished.connect(self._on_finished)
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setSingleShot(True)
+        self._ui_timer.setInterval(self.UI_UPDATE_INTERVAL_MS)
+        self._ui_timer.timeout.connect(self._flush_ui)
+
+    def reset(self, task: FileTransferTask):
+        """Show task in this widget, dropping the previous task (pooled widgets)"""
+        if self.task is not None:
+            try:
+                self.btn_cancel.clicked.disconnect(self.task.cancel)
+                self.task.progress_changed.disconnect(self._on_progress)
+                self.task.finished.disconnect(self._on_finished)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or the task is gone
+        self.task = task
+        # Constant for the task's lifetime
+        self._items_str = f"{len(task.sources)} item(s)"
+        self.label.setText("Preparing...")
+        self.progress.reset()
+        self.btn_cancel.setEnabled(True)
+        self.btn_cancel.clicked.connect(task.cancel)
+        task.progress_changed.connect(self._on_progress)
+        task.finished.connect(self._on_finished)
         self._start_time = time.monotonic()
-        self._last_time = self._start_time
-        self._last_done = 0
+        # (time, done) samples of the last SPEED_WINDOW seconds
+        self._samples = deque([(self._start_time, 0)], maxlen=64)
+        # Latest (done, total) not yet shown
+        self._pending = None
+        self._ui_timer.stop()
 
     def _on_progress(self, done, total):
+        self._pending = (done, total)
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
+
+    def _flush_ui(self):
+        if self._pending is None:
+            return
+        done, total = self._pending
+        self._pending = None
         pct = int(done * 100 / total) if total else 0
         self.progress.setValue(pct)
         now = time.monotonic()
-        delta_bytes = done - self._last_done
-        delta_time = max(1e-6, now - self._last_time)
-        speed = delta_bytes / delta_time  # bytes per second (instant)
-        self._last_time = now
-        self._last_done = done
+        samples = self._samples
+        samples.append((now, done))
+        while len(samples) > 2 and now - samples[1][0] >= self.SPEED_WINDOW:
+            samples.popleft()
+        window_start, window_done = samples[0]
+        # Bytes per second over the window: steadier than the last interval,
+        # quicker to follow changes than the overall average
+        speed = (done - window_done) / max(1e-6, now - window_start)
         avg_speed = done / max(1e-6, now - self._start_time)
         remaining = ''
         if speed > 0 and done < total:
@@ -50,43 +116,53 @@ class TransferWidget(QFrame):
             else:
                 remaining = f"ETA {eta_sec}s"
 
-        def fmt(bps: float):
-            units = ["B/s", "KB/s", "MB/s", "GB/s"]
-            v = float(bps)
-            for u in units:
-                if v < 1024 or u == units[-1]:
-                    return f"{v:.1f} {u}"
-                v /= 1024
-            return f"{v:.1f} B/s"
-
-        speed_str = fmt(speed)
-        avg_str = fmt(avg_speed)
-        parts = [f"{pct}%", f"{len(self.task.sources)} item(s)", speed_str, remaining]
+        speed_str = _fmt_bps(speed)
+        avg_str = _fmt_bps(avg_speed)
+        parts = [f"{pct}%", self._items_str, speed_str, remaining]
         if remaining:
             parts.append(f"avg {avg_str}")
         self.label.setText(" • ".join([p for p in parts if p]))
 
     def _on_finished(self, success, error):
+        self._ui_timer.stop()
+        # The final progress report usually arrives just before finished
+        self._flush_ui()
         self.btn_cancel.setEnabled(False)
         self.label.setText("Completed" if success else (error or "Failed"))
+        self.transfer_finished.emit()
 
 
 class TransferPanel(QWidget):
+    # Finished widgets kept for reuse, so bulk transfers don't rebuild them
+    MAX_POOLED_WIDGETS = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(4)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
+        self._pool: list[TransferWidget] = []
 
     def add_task(self, task: FileTransferTask):
-        tw = TransferWidget(task, self)
+        if self._pool:
+            tw = self._pool.pop()
+            tw.reset(task)
+        else:
+            tw = TransferWidget(task, self)
+            # Once per widget: reset() moves it to the next task's finished
+            tw.transfer_finished.connect(lambda: self._cleanup_later(tw))
         self.layout().addWidget(tw)
-        task.finished.connect(lambda *_: self._cleanup_later(tw))
+        tw.show()
 
     def _cleanup_later(self, tw: TransferWidget):
         QTimer.singleShot(3000, lambda: self._remove(tw))
 
     def _remove(self, tw: TransferWidget):
-        tw.setParent(None)
-        tw.deleteLater()
+        self.layout().removeWidget(tw)
+        if len(self._pool) < self.MAX_POOLED_WIDGETS:
+            tw.hide()
+            self._pool.append(tw)
+        else:
+            tw.setParent(None)
+            tw.deleteLater()
@@ -2,7 +2,10 @@
 Crash logging utility for LitterBox
 Logs fatal exceptions with timestamps and stack traces to a log file.
 """
+import atexit
+import queue
 import sys
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -16,16 +19,69 @@ class CrashLogger:
     LOG_DIR = Path.home() / ".local" / "share" / "litterbox"
     LOG_FILE = LOG_DIR / "crash.log"
     MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
+    _SEPARATOR = "=" * 80
+
+    # Most entries the writer thread appends per open of the log file
+    WRITE_BATCH_SIZE = 32
+
+    # (log file, entry) pairs waiting for the writer thread
+    _queue: "queue.Queue[tuple[Path, str]]" = queue.Queue()
+    _writer = None
+
+    # Append-mode descriptor of the log file, kept open between writes, and
+    # the file's size tracked in-process so rotation needs no stat per write
+    _fd = None
+    _fd_path = None
+    _bytes = 0
+    _fd_lock = threading.Lock()
+
+    # Formatted stack traces of recent exceptions, so an exception raised
+    # over and over doesn't reformat (and re-read source lines) every time
+    TB_CACHE_SIZE = 128
+    _tb_cache = {}
 
     @classmethod
     def setup(cls):
-        """Setup the crash logger directory"""
+        """Setup the crash logger directory and start the writer thread"""
         try:
             cls.LOG_DIR.mkdir(parents=True, exist_ok=True)
         except Exception:
             # If we can't create the directory, fall back to current directory
             cls.LOG_DIR = Path.cwd()
             cls.LOG_FILE = cls.LOG_DIR / "crash.log"
+        if cls._writer is None:
+            cls._writer = threading.Thread(target=cls._drain, name="CrashLogWriter", daemon=True)
+            cls._writer.start()
+            # The writer is a daemon thread; finish pending writes on exit
+            atexit.register(cls.flush)
+
+    @classmethod
+    def flush(cls):
+        """Wait until all logged entries are written"""
+        cls._queue.join()
+
+    @classmethod
+    def _drain(cls):
+        """Writer thread: append queued entries, batching those already waiting"""
+        while True:
+            batch = [cls._queue.get()]
+            while len(batch) < cls.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(cls._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                # Entries are grouped per file so each file gets one write
+                by_file = {}
+                for log_file, entry in batch:
+                    by_file.setdefault(log_file, []).append(entry)
+                for log_file, entries in by_file.items():
+                    cls._append(log_file, "".join(entries).encode('utf-8'))
+            except Exception as e:
+                print(f"Failed to write crash log: {e}", file=sys.stderr)
+            finally:
+                for _ in batch:
+                    cls._queue.task_done()
 
     @classmethod
     def log_exception(cls, exc_type, exc_value, exc_traceback):
@@ -40,27 +96,23 @@ class CrashLogger:
         try:
             cls.setup()
 
-            # Check log file size and rotate if needed
-            cls._rotate_log_if_needed()
-
             # Format the log entry
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            separator = "=" * 80
-
-            log_entry = f"\n{separator}\n"
-            log_entry += f"FATAL ERROR - {timestamp}\n"
-            log_entry += f"{separator}\n"
-
-            # Add exception information
-            log_entry += f"Exception Type: {exc_type.__name__}\n"
-            log_entry += f"Exception Message: {str(exc_value)}\n"
-            log_entry += f"\nStack Trace:\n"
-            log_entry += "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-            log_entry += f"{separator}\n"
-
-            # Write to log file
-            with open(cls.LOG_FILE, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            stack_trace = cls._format_traceback(exc_type, exc_value, exc_traceback)
+            log_entry = (
+                f"\n{cls._SEPARATOR}\n"
+                f"FATAL ERROR - {timestamp}\n"
+                f"{cls._SEPARATOR}\n"
+                f"Exception Type: {exc_type.__name__}\n"
+                f"Exception Message: {exc_value}\n"
+                "\nStack Trace:\n"
+                f"{stack_trace}"
+                f"{cls._SEPARATOR}\n"
+            )
+
+            # Write to log file on the writer thread, so a slow disk doesn't
+            # block the (GUI) thread that raised
+            cls._queue.put_nowait((cls.LOG_FILE, log_entry))
 
             # Also print to stderr for immediate visibility
             print(f"\nFATAL ERROR logged to: {cls.LOG_FILE}", file=sys.stderr)
@@ -72,25 +124,85 @@ class CrashLogger:
             traceback.print_exception(exc_type, exc_value, exc_traceback)
 
     @classmethod
-    def _rotate_log_if_needed(cls):
-        """Rotate log file if it exceeds maximum size"""
+    def _format_traceback(cls, exc_type, exc_value, exc_traceback) -> str:
+        """Format the exception like traceback.format_exception, cached"""
+        if exc_value is not None and (exc_value.__cause__ is not None
+                                      or exc_value.__context__ is not None):
+            # Chained exceptions are printed too; not worth keying on
+            return "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        key = (exc_type, str(exc_value), tuple(
+            (frame.f_code.co_filename, lineno)
+            for frame, lineno in traceback.walk_tb(exc_traceback)
+        ))
+        stack_trace = cls._tb_cache.get(key)
+        if stack_trace is None:
+            stack_trace = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+            if len(cls._tb_cache) >= cls.TB_CACHE_SIZE:
+                # Drop the oldest entry
+                del cls._tb_cache[next(iter(cls._tb_cache))]
+            cls._tb_cache[key] = stack_trace
+        return stack_trace
+
+    @classmethod
+    def _append(cls, log_file: Path, data: bytes):
+        """Append data to log_file, rotating it first if it exceeds maximum size"""
+        with cls._fd_lock:
+            if cls._fd_path != log_file:
+                cls._open_log(log_file)
+            if cls._bytes > cls.MAX_LOG_SIZE:
+                cls._rotate_log(log_file)
+                cls._open_log(log_file)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(cls._fd, view):]
+            cls._bytes += len(data)
+            # The log is rarely read back; don't let it crowd the page cache
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(cls._fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+
+    @classmethod
+    def _open_log(cls, log_file: Path):
+        cls._close_log()
+        cls._fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        cls._fd_path = log_file
+        cls._bytes = os.fstat(cls._fd).st_size
+
+    @classmethod
+    def _close_log(cls):
+        if cls._fd is not None:
+            os.close(cls._fd)
+            cls._fd = None
+            cls._fd_path = None
+
+    @classmethod
+    def _rotate_log(cls, log_file: Path):
+        """Move the log file aside as crash.log.old"""
+        cls._close_log()
         try:
-            if cls.LOG_FILE.exists():
-                file_size = cls.LOG_FILE.stat().st_size
-                if file_size > cls.MAX_LOG_SIZE:
-                    # Rename old log file
-                    backup_file = cls.LOG_FILE.with_suffix('.log.old')
-                    if backup_file.exists():
-                        backup_file.unlink()
-                    cls.LOG_FILE.rename(backup_file)
+            # Replaces any previous backup in the same rename
+            os.replace(log_file, f"{log_file}.old")
         except Exception:
             # If rotation fails, continue anyway
             pass
 
+    @classmethod
+    def handle_exception(cls, exc_type, exc_value, exc_traceback):
+        """sys.excepthook: log the exception and wait until it is on disk.
+
+        The process may be about to abort (PyQt does after an exception in a
+        slot), and atexit handlers don't run then, so the entry is written
+        before returning.
+        """
+        cls.log_exception(exc_type, exc_value, exc_traceback)
+        cls.flush()
+
     @classmethod
     def install_exception_handler(cls):
         """Install the crash logger as the global exception handler"""
-        sys.excepthook = cls.log_exception
+        sys.excepthook = cls.handle_exception
 
     @classmethod
     def get_log_path(cls) -> str:
@@ -101,7 +213,10 @@ class CrashLogger:
     @classmethod
     def clear_log(cls):
         """Clear the crash log file"""
+        cls.flush()
         try:
+            with cls._fd_lock:
+                cls._close_log()
             if cls.LOG_FILE.exists():
                 cls.LOG_FILE.unlink()
         except Exception as e:
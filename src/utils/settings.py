@@ -4,21 +4,69 @@ Settings management for LitterBox
 import json
 import os
 import base64
+from functools import lru_cache
 from pathlib import Path
-from PyQt6.QtCore import QByteArray
+from PyQt6.QtCore import QByteArray, QCoreApplication, QTimer
+
+# orjson is optional: it encodes/decodes the settings several times faster
+try:  # pragma: no cover - availability is environment dependent
+    import orjson
+
+    def _dumps(obj, indent=False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _dumps(obj, indent=False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+    _loads = json.loads
+
+
+# Resolved once at import
+_CONFIG_DIR = Path.home() / ".config" / "litterbox"
+
+
+@lru_cache(maxsize=None)
+def _is_binary_key(key: str) -> bool:
+    """Whether key holds a QByteArray stored as base64 (geometry/state)"""
+    lowered = key.lower()
+    return "geometry" in lowered or "state" in lowered
+
 
 class Settings:
-    # Class-level cache to share data between instances
-    _cached_settings = None
-    _cache_file_mtime = None
+    # Process-wide instance; its in-memory dict is the source of truth
+    _instance = None
+
+    # Delay before changed settings are written to disk
+    FLUSH_DELAY_MS = 500
+    # Changes are appended to the journal; past this size it is merged back
+    # into settings.json
+    JOURNAL_MAX_BYTES = 64 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
 
     def __init__(self):
-        self.config_dir = Path.home() / ".config" / "litterbox"
+        if self._initialized:
+            return
+        self._initialized = True
+        self.config_dir = _CONFIG_DIR
         self.config_file = self.config_dir / "settings.json"
+        self.journal_file = self.config_dir / "settings.journal"
         self.settings = self.load_settings()
+        self._flush_timer = None
+        # Keys changed since the last flush, and the open journal
+        self._dirty = set()
+        self._journal = None
+        # Decoded QByteArray values of binary keys
+        self._decoded = {}
 
     def load_settings(self):
-        """Load settings from config file with caching"""
+        """Load settings from config file"""
         default_settings = {
             "window_geometry": None,
             "sort_column": 0,  # Name column
@@ -27,56 +75,98 @@ class Settings:
             "column_widths": [200, 100, 150]  # Default widths for Name, Size, Modified columns
         }
 
-        if not self.config_file.exists():
-            return default_settings
-
+        if self.config_file.exists():
+            try:
+                with open(self.config_file, 'rb') as f:
+                    loaded = _loads(f.read())
+                    # Merge with defaults to handle new settings
+                    default_settings.update(loaded)
+            except (ValueError, OSError):
+                pass
+
+        # Replay changes made since settings.json was last written
         try:
-            # Check file modification time for cache invalidation
-            current_mtime = self.config_file.stat().st_mtime
-
-            # Use cached settings if file hasn't changed
-            if (Settings._cached_settings is not None and
-                Settings._cache_file_mtime == current_mtime):
-                return Settings._cached_settings.copy()
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        default_settings.update(_loads(line))
+                    except ValueError:
+                        continue  # Torn last line after a crash
+        except OSError:
+            pass
 
-            # Load from file
-            with open(self.config_file, 'r') as f:
-                loaded = json.load(f)
-                # Merge with defaults to handle new settings
-                default_settings.update(loaded)
-
-                # Cache the result
-                Settings._cached_settings = default_settings.copy()
-                Settings._cache_file_mtime = current_mtime
-
-                return default_settings
-        except (json.JSONDecodeError, IOError, OSError):
-            return default_settings
+        return default_settings
 
     def save_settings(self):
-        """Save current settings to config file"""
+        """Write all settings to the config file now and empty the journal"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        self._dirty.clear()
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.settings, indent=True))
+                # Make sure the data is on disk before it replaces the old
+                # file, so a crash leaves either the old or the new settings
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self.journal_file.unlink(missing_ok=True)
+        except OSError:
+            pass  # Silently fail if we can't save
 
-            # Invalidate cache after saving
-            Settings._cached_settings = None
-            Settings._cache_file_mtime = None
-        except IOError:
+    def _flush(self):
+        """Append the changed settings to the journal"""
+        if not self._dirty:
+            return
+        changes = {key: self.settings[key] for key in self._dirty}
+        self._dirty.clear()
+        try:
+            if self._journal is None:
+                self.config_dir.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_file, 'ab')
+            self._journal.write(_dumps(changes) + b"\n")
+            self._journal.flush()
+            if self._journal.tell() > self.JOURNAL_MAX_BYTES:
+                self.save_settings()
+        except OSError:
             pass  # Silently fail if we can't save
 
+    def _schedule_flush(self, key):
+        """Journal key once settings stop changing for FLUSH_DELAY_MS"""
+        self._dirty.add(key)
+        if QCoreApplication.instance() is None:
+            # No event loop to run the timer
+            self._flush()
+            return
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start()
+
     def get(self, key, default=None):
         """Get a setting value"""
+        decoded = self._decoded.get(key)
+        if decoded is not None:
+            # Implicitly shared copy, callers can't change the cached value
+            return QByteArray(decoded)
+
         value = self.settings.get(key, default)
 
         # Convert base64 string back to QByteArray for geometry-related keys
-        if ("geometry" in key.lower() or "state" in key.lower()) and isinstance(value, str) and value:
+        if _is_binary_key(key) and isinstance(value, str) and value:
             try:
-                data = base64.b64decode(value.encode('utf-8'))
-                return QByteArray(data)
+                decoded = QByteArray(base64.b64decode(value.encode('utf-8')))
             except Exception:
                 return default
+            self._decoded[key] = decoded
+            return QByteArray(decoded)
 
         return value
 
@@ -86,21 +176,18 @@ class Settings:
         if isinstance(value, QByteArray):
             value = base64.b64encode(value.data()).decode('utf-8')
 
-        # Always reload settings before modifying to get latest data
-        self.settings = self.load_settings()
         self.settings[key] = value
-        self.save_settings()
+        self._decoded.pop(key, None)
+        self._schedule_flush(key)
 
     def get_column_widths(self, default_widths=None):
-        """Get column widths with fallback to defaults, always reload from file"""
+        """Get column widths with fallback to defaults"""
         if default_widths is None:
             default_widths = [200, 100, 150]  # Name, Size, Modified
 
-        # Always reload from file to get the latest values
-        self.settings = self.load_settings()
         return self.settings.get("column_widths", default_widths)
 
     def set_column_widths(self, widths):
         """Set column widths"""
         self.settings["column_widths"] = list(widths)
-        self.save_settings()
+        self._schedule_flush("column_widths")
@@ -14,12 +14,48 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 from PyQt6.QtWidgets import QApplication
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def qapp():
     """Provide a single QApplication instance for the whole test session.
 
     Avoids creating/destroying multiple QApplication objects which can cause
     segmentation faults in some PyQt builds when tests are run collectively.
+    Not autouse: Qt-free tests such as the crash logger ones don't need it.
     """
     app = QApplication.instance() or QApplication([])
     yield app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _settings_outside_home(tmp_path_factory):
+    """Keep settings written by any test out of the real ~/.config/litterbox.
+
+    The settings directory is resolved at import and Settings is a singleton,
+    so patching Path.home() in a test doesn't redirect it.
+    """
+    import utils.settings as settings_module
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings_module, '_CONFIG_DIR', tmp_path_factory.mktemp("config") / "litterbox")
+        mp.setattr(settings_module.Settings, '_instance', None)
+        yield
+
+
+@pytest.fixture
+def isolated_settings(tmp_path, monkeypatch):
+    """Fresh Settings singleton state stored under tmp_path; returns the config directory"""
+    import utils.settings as settings_module
+    config_dir = tmp_path / ".config" / "litterbox"
+    monkeypatch.setattr(settings_module, '_CONFIG_DIR', config_dir)
+    monkeypatch.setattr(settings_module.Settings, '_instance', None)
+    return config_dir
+
+
+@pytest.fixture
+def window(qapp, tmp_path, isolated_settings):
+    """MainWindow started in a temporary home directory, with isolated settings"""
+    from unittest.mock import patch
+    from ui.main_window import MainWindow
+    with patch('pathlib.Path.home', return_value=tmp_path):
+        win = MainWindow()
+        yield win
+        win.deleteLater()
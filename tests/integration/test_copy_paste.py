@@ -9,7 +9,7 @@ import pytest
 from pathlib import Path
 
 sys.path.insert(0, 'src')
-from core.file_transfer import FileTransferManager, ConflictDecision, suggest_rename
+from core.file_transfer import CHUNK_SIZE, FileTransferManager, FileTransferTask, ConflictDecision, suggest_rename
 
 @pytest.fixture(autouse=True)
 def _ensure_qapp(qapp):  # noqa: PT004
@@ -185,3 +185,34 @@ def test_nested_conflicts_overwrite_apply_all():
         assert len(calls) == 1, f"expected 1 conflict prompt, got {len(calls)}"
         assert (dest_root/'a.txt').stat().st_size == 5
         assert (dest_root/'sub'/'b.txt').stat().st_size == 5
+
+
+def test_tasks_idle_emitted_when_last_task_finishes():
+    with tempfile.TemporaryDirectory() as srcd, tempfile.TemporaryDirectory() as dstd:
+        srcf = Path(srcd)/'file.txt'
+        create_file(srcf, 10)
+        mgr = FileTransferManager()
+        idle = []
+        mgr.tasks_idle.connect(lambda: idle.append(True))
+        task = mgr.start_transfer([str(srcf)], dstd, move=False)
+        success, err = wait_task(task)
+        assert success, err
+        QApplication.processEvents()
+        assert idle == [True]
+        assert mgr.active_tasks() == []
+
+
+def test_progress_emits_are_rate_limited():
+    with tempfile.TemporaryDirectory() as srcd, tempfile.TemporaryDirectory() as dstd:
+        srcf = Path(srcd)/'big.bin'
+        create_file(srcf, 16 * CHUNK_SIZE)
+        task = FileTransferTask([str(srcf)], dstd, move=False)
+        progress = []
+        task.progress_changed.connect(lambda done, total: progress.append((done, total)))
+        task.start()
+        success, err = wait_task(task)
+        assert success, err
+        QApplication.processEvents()
+        # One emit per chunk would be 17 including the initial (0, total)
+        assert len(progress) < 17
+        assert progress[-1] == (16 * CHUNK_SIZE, 16 * CHUNK_SIZE)
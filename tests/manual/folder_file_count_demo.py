@@ -16,34 +16,24 @@ def create_test_structure(base_path: Path):
     """Create a test directory structure"""
     print(f"Creating test structure in {base_path}")
 
-    # Create files in root
-    (base_path / "file1.txt").write_text("Content 1")
-    (base_path / "file2.txt").write_text("Content 2")
-    (base_path / "file3.md").write_text("# README")
-
-    # Create subdirectory with files
-    docs = base_path / "documents"
-    docs.mkdir()
-    (docs / "doc1.txt").write_text("Document 1")
-    (docs / "doc2.txt").write_text("Document 2")
-    (docs / "notes.txt").write_text("Notes")
-
-    # Create nested subdirectory
-    reports = docs / "reports"
-    reports.mkdir()
-    (reports / "report1.pdf").write_text("PDF content 1")
-    (reports / "report2.pdf").write_text("PDF content 2")
-
-    # Create another subdirectory
-    images = base_path / "images"
-    images.mkdir()
-    (images / "photo1.jpg").write_text("JPEG data 1")
-    (images / "photo2.jpg").write_text("JPEG data 2")
-    (images / "photo3.png").write_text("PNG data")
-
-    # Create an empty subdirectory
-    empty = base_path / "empty"
-    empty.mkdir()
+    # Directories first, then every file in one pass
+    for folder in ("documents/reports", "images", "empty"):
+        (base_path / folder).mkdir(parents=True)
+    files = {
+        "file1.txt": "Content 1",
+        "file2.txt": "Content 2",
+        "file3.md": "# README",
+        "documents/doc1.txt": "Document 1",
+        "documents/doc2.txt": "Document 2",
+        "documents/notes.txt": "Notes",
+        "documents/reports/report1.pdf": "PDF content 1",
+        "documents/reports/report2.pdf": "PDF content 2",
+        "images/photo1.jpg": "JPEG data 1",
+        "images/photo2.jpg": "JPEG data 2",
+        "images/photo3.png": "PNG data",
+    }
+    for name, content in files.items():
+        (base_path / name).write_text(content)
 
     print(f"\nCreated structure:")
     print(f"  3 files in root")
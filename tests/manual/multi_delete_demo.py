@@ -27,6 +27,10 @@ def create_test_files():
     """Create a temporary directory with test files"""
     temp_dir = tempfile.mkdtemp(prefix='litterbox_multi_delete_test_')
 
+    # Create a test folder up front, before any files
+    test_folder = os.path.join(temp_dir, 'test_folder')
+    os.makedirs(test_folder)
+
     # Create several test files
     test_files = [
         'document1.txt',
@@ -43,10 +47,6 @@ def create_test_files():
             f.write(f"Test content for {filename}\n")
             f.write("You can safely delete this file.\n")
 
-    # Create a test folder
-    test_folder = os.path.join(temp_dir, 'test_folder')
-    os.makedirs(test_folder)
-
     # Create a file inside the folder
     nested_file = os.path.join(test_folder, 'nested_file.txt')
     with open(nested_file, 'w') as f:
@@ -12,7 +12,29 @@ from pathlib import Path
 sys.path.insert(0, 'src')
 
 from core.file_operations import FileOperations
-from ui.main_window import FileTab
+
+# Names in /usr/bin, listed once instead of a stat() per probed program
+try:
+    _USR_BIN = {entry.name for entry in os.scandir('/usr/bin')}
+except OSError:
+    _USR_BIN = set()
+
+def installed(path):
+    """Whether the program at path exists"""
+    if os.path.dirname(path) == '/usr/bin':
+        return os.path.basename(path) in _USR_BIN
+    return os.path.exists(path)
+
+def write_script(suffix, content):
+    """Create an executable temporary script and return its path"""
+    # mkstemp hands back the open descriptor, so no reopen is needed to write
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        os.fchmod(fd, 0o755)
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+    return path
 
 def test_executable_detection():
     """Test executable type detection"""
@@ -23,7 +45,7 @@ def test_executable_detection():
     
     print("\nConsole Applications:")
     for app in console_apps:
-        if os.path.exists(app):
+        if installed(app):
             exec_type = FileOperations.get_executable_type(app)
             print(f"  {app}: {exec_type}")
     
@@ -31,15 +53,9 @@ def test_executable_detection():
     print("\nScript Files:")
     
     # Create test scripts
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-        f.write('#!/bin/bash\necho "Hello from shell script"')
-        bash_script = f.name
-    os.chmod(bash_script, 0o755)
+    bash_script = write_script('.sh', '#!/bin/bash\necho "Hello from shell script"')
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write('#!/usr/bin/env python3\nprint("Hello from Python script")')
-        python_script = f.name
-    os.chmod(python_script, 0o755)
+    python_script = write_script('.py', '#!/usr/bin/env python3\nprint("Hello from Python script")')
     
     test_scripts = [bash_script, python_script]
     
@@ -56,7 +72,7 @@ def test_executable_detection():
     
     gui_found = False
     for app in potential_gui_apps:
-        if os.path.exists(app):
+        if installed(app):
             exec_type = FileOperations.get_executable_type(app)
             print(f"  {app}: {exec_type}")
             if exec_type == 'gui':
@@ -74,10 +90,7 @@ def test_run_methods():
     print("\n=== Testing Run Methods ===")
     
     # Create a test console script
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-        f.write('#!/bin/bash\necho "Test script executed successfully"')
-        test_script = f.name
-    os.chmod(test_script, 0o755)
+    test_script = write_script('.sh', '#!/bin/bash\necho "Test script executed successfully"')
     
     print(f"\nTest script: {test_script}")
     
@@ -104,10 +117,7 @@ def test_dialog_logic():
     ]
     
     # Create test script
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write('#!/usr/bin/env python3\nprint("Hello")')
-        script_path = f.name
-    os.chmod(script_path, 0o755)
+    script_path = write_script('.py', '#!/usr/bin/env python3\nprint("Hello")')
     
     test_cases.append((script_path, 'script', 'Should show dialog with terminal/direct options (default: terminal)'))
     
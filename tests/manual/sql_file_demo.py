@@ -10,13 +10,17 @@ Usage:
     python tests/manual/sql_file_demo.py [path_to_sql_file]
 """
 
+import re
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from core.application_manager import ApplicationManager
+# Name keywords (matched anywhere in the name) used to categorize applications
+DB_RE = re.compile(r'dbeaver|mysql|postgres|pgadmin|sql|database', re.IGNORECASE)
+EDITOR_RE = re.compile(r'edit|text|kate|gedit|emacs|vim|code|sublime|atom|notepad'
+                       r'|nano|helix|textadept', re.IGNORECASE)
 
 
 def demo_sql_file_discovery(sql_file_path: str):
@@ -30,6 +34,9 @@ def demo_sql_file_discovery(sql_file_path: str):
         print(f"Error: File not found: {sql_file_path}")
         return
 
+    # Imported only now, so a bad path is reported without loading it
+    from core.application_manager import ApplicationManager
+
     # Initialize application manager
     app_manager = ApplicationManager()
 
@@ -54,16 +61,10 @@ def demo_sql_file_discovery(sql_file_path: str):
     text_editors = []
     other_apps = []
 
-    db_keywords = ['dbeaver', 'mysql', 'postgres', 'pgadmin', 'sql', 'database']
-    editor_keywords = ['edit', 'text', 'kate', 'gedit', 'emacs', 'vim', 'code',
-                       'sublime', 'atom', 'notepad', 'nano', 'helix', 'textadept']
-
     for app in applications:
-        name_lower = app.name.lower()
-
-        if any(keyword in name_lower for keyword in db_keywords):
+        if DB_RE.search(app.name):
             db_tools.append(app)
-        elif any(keyword in name_lower for keyword in editor_keywords):
+        elif EDITOR_RE.search(app.name):
             text_editors.append(app)
         else:
             other_apps.append(app)
@@ -10,6 +10,7 @@ Usage:
     python tests/manual/text_like_apps_demo.py
 """
 
+import re
 import sys
 import tempfile
 from pathlib import Path
@@ -19,6 +20,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from core.application_manager import ApplicationManager
 
+# Name keywords (matched anywhere in the name) that mark a text editor
+EDITOR_RE = re.compile(r'edit|text|kate|gedit|emacs|vim|code|sublime|atom|notepad'
+                       r'|nano|helix|textadept', re.IGNORECASE)
+
 
 def test_file_type(app_manager, filename, content):
     """Test application discovery for a specific file type."""
@@ -33,10 +38,7 @@ def test_file_type(app_manager, filename, content):
     applications = app_manager.get_applications_for_file(str(test_file))
 
     # Count text editors
-    editor_keywords = ['edit', 'text', 'kate', 'gedit', 'emacs', 'vim', 'code',
-                       'sublime', 'atom', 'notepad', 'nano', 'helix', 'textadept']
-    text_editors = [app for app in applications
-                    if any(kw in app.name.lower() for kw in editor_keywords)]
+    text_editors = [app for app in applications if EDITOR_RE.search(app.name)]
 
     print(f"\\n{'=' * 70}")
     print(f"File: {filename}")
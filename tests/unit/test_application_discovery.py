@@ -1,4 +1,4 @@
-import os, tempfile, textwrap, sys, subprocess
+import configparser, os, tempfile, textwrap, sys, subprocess
 from unittest.mock import patch
 
 # Add src directory to import path
@@ -7,7 +7,7 @@ SRC_DIR = os.path.join(CURRENT_DIR, 'src')
 if os.path.isdir(SRC_DIR) and SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
-from core.application_manager import ApplicationManager
+from core.application_manager import ApplicationManager, DesktopApplication, get_app_manager
 
 ODT_MIME = 'application/vnd.oasis.opendocument.text'
 
@@ -82,3 +82,119 @@ def test_get_mime_type_prefers_extension_when_generic(tmp_path):
 
     assert py_mime == 'text/x-python'
     assert txt_mime == 'text/plain'
+
+
+def test_get_app_manager_returns_shared_instance():
+    manager = get_app_manager()
+    assert isinstance(manager, ApplicationManager)
+    assert get_app_manager() is manager
+
+
+def test_desktop_file_parsed_once_until_modified(tmp_path):
+    desktop = tmp_path / 'editor.desktop'
+    desktop.write_text('[Desktop Entry]\nName=Editor\nExec=editor %f\nMimeType=text/plain;\n')
+
+    with patch('configparser.ConfigParser.read', autospec=True,
+               side_effect=configparser.ConfigParser.read) as read:
+        first = DesktopApplication(str(desktop))
+        second = DesktopApplication(str(desktop))
+        assert read.call_count == 1
+
+        st = desktop.stat()
+        desktop.write_text('[Desktop Entry]\nName=Writer\nExec=writer %f\nMimeType=text/plain;\n')
+        os.utime(desktop, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        third = DesktopApplication(str(desktop))
+        assert read.call_count == 2
+
+    assert first.name == second.name == 'Editor'
+    assert third.name == 'Writer'
+    first.mime_types.append('text/x-other')
+    assert second.mime_types == ['text/plain']
+
+
+def test_application_scan_shared_until_directory_changes(tmp_path):
+    apps_dir = tmp_path / 'applications'
+    apps_dir.mkdir()
+    (apps_dir / 'one.desktop').write_text('[Desktop Entry]\nName=One\nExec=one %f\n')
+
+    first = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])._get_all_applications()
+    with patch('core.application_manager.DesktopApplication') as desktop_app:
+        second = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])._get_all_applications()
+    assert desktop_app.call_count == 0
+    assert [app.path for app in second] == [app.path for app in first]
+
+    st = apps_dir.stat()
+    (apps_dir / 'two.desktop').write_text('[Desktop Entry]\nName=Two\nExec=two %f\n')
+    os.utime(apps_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    third = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])._get_all_applications()
+    assert str(apps_dir / 'two.desktop') in [app.path for app in third]
+
+
+def test_shared_scan_rereads_file_edited_in_place(tmp_path):
+    apps_dir = tmp_path / 'applications'
+    apps_dir.mkdir()
+    desktop = apps_dir / 'one.desktop'
+    desktop.write_text('[Desktop Entry]\nName=One\nExec=one %f\n')
+    first = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])._get_all_applications()
+    original = next(app for app in first if app.path == str(desktop))
+    assert original.name == 'One'
+
+    st = apps_dir.stat()
+    desktop.write_text('[Desktop Entry]\nName=One Edited\nExec=one %f\n')
+    os.utime(apps_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    second = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])._get_all_applications()
+
+    assert [app.name for app in second if app.path == str(desktop)] == ['One Edited']
+    assert original.name == 'One'
+
+
+def test_manager_picks_up_applications_installed_later(tmp_path):
+    apps_dir = tmp_path / 'applications'
+    apps_dir.mkdir()
+    (apps_dir / 'one.desktop').write_text('[Desktop Entry]\nName=One\nExec=one %f\nMimeType=text/x-test;\n')
+    mgr = ApplicationManager(extra_desktop_dirs=[str(apps_dir)])
+    assert [app.name for app in mgr.get_applications_for_mime_type('text/x-test')] == ['One']
+
+    st = apps_dir.stat()
+    (apps_dir / 'two.desktop').write_text('[Desktop Entry]\nName=Two\nExec=two %f\nMimeType=text/x-test;\n')
+    os.utime(apps_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert [app.name for app in mgr.get_applications_for_mime_type('text/x-test')] == ['One', 'Two']
+
+
+def test_set_default_application_drops_rankings(tmp_path):
+    mgr = ApplicationManager()
+    mgr._rank_cache[('text/plain', '.txt', ('text/plain',))] = []
+
+    with patch('core.application_manager.subprocess.run'):
+        assert mgr.set_default_application('text/plain', 'editor.desktop')
+
+    assert mgr._rank_cache == {}
+
+
+def test_path_mime_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(ApplicationManager, 'PATH_MIME_CACHE_SIZE', 2)
+    mgr = ApplicationManager()
+    paths = []
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        path = tmp_path / name
+        path.write_text('x')
+        paths.append(str(path))
+
+    mgr.get_mime_type(paths[0], skip_system_query=True)
+    mgr.get_mime_type(paths[1], skip_system_query=True)
+    mgr.get_mime_type(paths[0], skip_system_query=True)  # Now most recently used
+    mgr.get_mime_type(paths[2], skip_system_query=True)
+
+    assert list(mgr._path_mime_cache) == [paths[0], paths[2]]
+
+
+def test_can_handle_mime_type(tmp_path):
+    desktop = tmp_path / 'viewer.desktop'
+    desktop.write_text('[Desktop Entry]\nName=Viewer\nExec=viewer %f\nMimeType=image/png;image/jpeg;\n')
+
+    app = DesktopApplication(str(desktop))
+
+    assert app.can_handle_mime_type('image/jpeg')
+    assert not app.can_handle_mime_type('text/plain')
+    assert not DesktopApplication(str(tmp_path / 'missing.desktop')).can_handle_mime_type('image/png')
@@ -0,0 +1,39 @@
+"""
+Unit tests for ClipboardManager payload serialization
+"""
+import sys
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from core.clipboard_manager import ClipboardManager
+
+
+def test_build_payload_serializes_paths(tmp_path):
+    a = tmp_path / 'a.txt'
+    b = tmp_path / 'b.txt'
+
+    payload = ClipboardManager.build_payload([str(a), str(b)], operation='cut')
+
+    assert payload.operation == 'cut'
+    assert payload.gnome_data.decode('utf-8').splitlines() == ['cut', f'file://{a}', f'file://{b}']
+    assert payload.text == f'{a}\n{b}'
+    assert payload.abs_paths == [str(a), str(b)]
+
+
+def test_build_payload_rejects_unknown_operation(tmp_path):
+    payload = ClipboardManager.build_payload([str(tmp_path)], operation='bogus')
+    assert payload.operation == 'copy'
+
+
+def test_set_payload_round_trip(qapp, tmp_path):
+    a = tmp_path / 'a.txt'
+    a.write_text('a')
+
+    ClipboardManager.set_payload(ClipboardManager.build_payload([str(a)], operation='cut'))
+    content = ClipboardManager.get_files()
+
+    assert content is not None
+    assert content.operation == 'cut'
+    assert content.paths == [str(a)]
@@ -0,0 +1,53 @@
+"""
+Unit tests for per-transfer "apply to all" conflict decision caching in MainWindow
+"""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, 'src')
+
+from core.file_transfer import ConflictDecision
+
+
+def test_apply_all_decision_skips_further_prompts(window):
+    decision = ConflictDecision('overwrite', apply_all=True)
+    with patch.object(window, '_conflict_handler', return_value=decision) as prompt:
+        handler = window._new_conflict_handler()
+        first = handler(Path('/dst/a'), Path('/src/a'))
+        second = handler(Path('/dst/b'), Path('/src/b'))
+
+    assert prompt.call_count == 1
+    assert first.action == 'overwrite'
+    assert second.action == 'overwrite'
+    assert second.apply_all
+
+
+def test_rename_apply_all_keeps_strategy_only(window):
+    decision = ConflictDecision('rename', apply_all=True, new_path=Path('/dst/a (2)'))
+    with patch.object(window, '_conflict_handler', return_value=decision):
+        handler = window._new_conflict_handler()
+        handler(Path('/dst/a'), Path('/src/a'))
+        second = handler(Path('/dst/b'), Path('/src/b'))
+
+    assert second.action == 'rename'
+    assert second.new_path is None
+
+
+def test_single_decisions_prompt_every_time(window):
+    decision = ConflictDecision('skip')
+    with patch.object(window, '_conflict_handler', return_value=decision) as prompt:
+        handler = window._new_conflict_handler()
+        handler(Path('/dst/a'), Path('/src/a'))
+        handler(Path('/dst/b'), Path('/src/b'))
+
+    assert prompt.call_count == 2
+
+
+def test_each_transfer_gets_fresh_state(window):
+    decision = ConflictDecision('overwrite', apply_all=True)
+    with patch.object(window, '_conflict_handler', return_value=decision) as prompt:
+        window._new_conflict_handler()(Path('/dst/a'), Path('/src/a'))
+        window._new_conflict_handler()(Path('/dst/a'), Path('/src/a'))
+
+    assert prompt.call_count == 2
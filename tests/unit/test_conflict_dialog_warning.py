@@ -1,7 +1,4 @@
 """Tests for warning label behavior in ConflictDialog after style update."""
-import tempfile
-from pathlib import Path
-
 from ui.conflict_dialog import ConflictDialog
 from PyQt6.QtCore import QCoreApplication
 
@@ -10,70 +7,119 @@ def _process():
     QCoreApplication.processEvents()
 
 
-def test_warning_visibility_for_existing_alternate_name(qapp):
+def test_warning_visibility_for_existing_alternate_name(qapp, tmp_path):
     """Warning shows when a different existing name is entered."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        existing = Path(tmpdir) / "foo.txt"
-        existing.touch()
-        (Path(tmpdir) / "foo (1).txt").touch()
-
-        dlg = ConflictDialog(
-            filename="foo.txt",
-            parent=None,
-            source_path=None,
-            existing_path=str(existing)
-        )
-        dlg.show(); _process()
-
-        # Suggested should skip existing numbers -> foo (2).txt
-        assert dlg.rename_edit.text() == "foo (2).txt"
-        assert not dlg.name_conflict_warning.isVisible()
-
-        # Enter an existing alternate name
-        dlg.rename_edit.setText("foo (1).txt"); _process()
-        assert dlg.name_conflict_warning.isVisible()
-        assert not dlg.ok_btn.isEnabled()
-
-
-def test_warning_not_shown_for_original_or_empty(qapp):
+    existing = tmp_path / "foo.txt"
+    existing.touch()
+    (tmp_path / "foo (1).txt").touch()
+
+    dlg = ConflictDialog(
+        filename="foo.txt",
+        parent=None,
+        source_path=None,
+        existing_path=str(existing)
+    )
+    dlg.show(); _process()
+
+    # Suggested should skip existing numbers -> foo (2).txt
+    assert dlg.rename_edit.text() == "foo (2).txt"
+    assert not dlg.name_conflict_warning.isVisible()
+
+    # Enter an existing alternate name. textChanged is a direct connection,
+    # so the warning is updated by the time setText() returns
+    dlg.rename_edit.setText("foo (1).txt")
+    assert dlg.name_conflict_warning.isVisible()
+    assert not dlg.ok_btn.isEnabled()
+
+
+def test_warning_not_shown_for_original_or_empty(qapp, tmp_path):
     """Original name or empty input disables OK but does not show warning."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        existing = Path(tmpdir) / "bar.txt"
-        existing.touch()
+    existing = tmp_path / "bar.txt"
+    existing.touch()
 
-        dlg = ConflictDialog(
-            filename="bar.txt",
-            parent=None,
-            source_path=None,
-            existing_path=str(existing)
-        )
-        dlg.show(); _process()
+    dlg = ConflictDialog(
+        filename="bar.txt",
+        parent=None,
+        source_path=None,
+        existing_path=str(existing)
+    )
+    dlg.show(); _process()
 
-        dlg.rename_edit.setText("bar.txt"); _process()
-        assert not dlg.name_conflict_warning.isVisible()
-        assert not dlg.ok_btn.isEnabled()
+    dlg.rename_edit.setText("bar.txt")
+    assert not dlg.name_conflict_warning.isVisible()
+    assert not dlg.ok_btn.isEnabled()
 
-        dlg.rename_edit.setText(""); _process()
-        assert not dlg.name_conflict_warning.isVisible()
-        assert not dlg.ok_btn.isEnabled()
+    dlg.rename_edit.setText("")
+    assert not dlg.name_conflict_warning.isVisible()
+    assert not dlg.ok_btn.isEnabled()
 
 
-def test_warning_style_sheet_has_box(qapp):
+def test_warning_style_sheet_has_box(qapp, tmp_path):
     """Ensure style uses background, border and not bold red legacy style."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        existing = Path(tmpdir) / "baz.txt"
-        existing.touch()
-        dlg = ConflictDialog(
-            filename="baz.txt",
-            parent=None,
-            source_path=None,
-            existing_path=str(existing)
-        )
-        # We expect new style properties
-        ss = dlg.name_conflict_warning.styleSheet()
-        assert "background-color" in ss
-        assert "border-radius" in ss
-        assert "padding" in ss
-        # Old bold red markers should be absent
-        assert "font-weight: bold" not in ss
-        assert "#d32f2f" not in ss
+    existing = tmp_path / "baz.txt"
+    existing.touch()
+    dlg = ConflictDialog(
+        filename="baz.txt",
+        parent=None,
+        source_path=None,
+        existing_path=str(existing)
+    )
+    # We expect new style properties
+    ss = dlg.name_conflict_warning.styleSheet()
+    assert "background-color" in ss
+    assert "border-radius" in ss
+    assert "padding" in ss
+    # Old bold red markers should be absent
+    assert "font-weight: bold" not in ss
+    assert "#d32f2f" not in ss
+
+
+def test_warning_shows_for_dangling_symlink(qapp, tmp_path):
+    """A dangling symlink still occupies its name."""
+    existing = tmp_path / "qux.txt"
+    existing.touch()
+    (tmp_path / "dangling.txt").symlink_to(tmp_path / "missing")
+
+    dlg = ConflictDialog(
+        filename="qux.txt",
+        parent=None,
+        source_path=None,
+        existing_path=str(existing)
+    )
+    dlg.show(); _process()
+
+    dlg.rename_edit.setText("dangling.txt")
+    assert dlg.name_conflict_warning.isVisible()
+    assert not dlg.ok_btn.isEnabled()
+
+    dlg.rename_edit.setText("free.txt")
+    assert not dlg.name_conflict_warning.isVisible()
+    assert dlg.ok_btn.isEnabled()
+
+
+def test_validation_lists_directory_once(qapp, tmp_path, monkeypatch):
+    """Typing reuses one directory listing until refresh_siblings()."""
+    import os
+    existing = tmp_path / "quux.txt"
+    existing.touch()
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    dlg = ConflictDialog(
+        filename="quux.txt",
+        parent=None,
+        source_path=None,
+        existing_path=str(existing)
+    )
+    dlg.show(); _process()
+
+    for text in ("n", "ne", "new", "new.txt"):
+        dlg.rename_edit.setText(text)
+    assert len(scans) == 1
+    assert dlg.ok_btn.isEnabled()
+
+    (tmp_path / "new.txt").touch()
+    dlg.refresh_siblings()
+    dlg.rename_edit.setText("new.txt ")
+    assert dlg.name_conflict_warning.isVisible()
+    assert len(scans) == 2
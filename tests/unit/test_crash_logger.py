@@ -14,6 +14,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from utils.crash_logger import CrashLogger
 
 
+@pytest.fixture(scope='module')
+def sample_exc_info():
+    """One raised exception shared by the tests that only need some error"""
+    try:
+        raise ValueError("Test error message")
+    except ValueError:
+        return sys.exc_info()
+
+
 class TestCrashLogger:
     """Test crash logger functionality"""
 
@@ -35,7 +44,7 @@ class TestCrashLogger:
             CrashLogger.LOG_DIR = original_dir
             CrashLogger.LOG_FILE = original_file
 
-    def test_log_exception(self, tmp_path):
+    def test_log_exception(self, tmp_path, sample_exc_info):
         """Test logging an exception"""
         # Override log directory for testing
         original_dir = CrashLogger.LOG_DIR
@@ -45,12 +54,9 @@ class TestCrashLogger:
             CrashLogger.LOG_DIR = tmp_path / "test_logs"
             CrashLogger.LOG_FILE = CrashLogger.LOG_DIR / "crash.log"
 
-            # Create a test exception
-            try:
-                raise ValueError("Test error message")
-            except Exception as e:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                CrashLogger.log_exception(exc_type, exc_value, exc_traceback)
+            CrashLogger.log_exception(*sample_exc_info)
+
+            CrashLogger.flush()
 
             # Verify log file was created
             assert CrashLogger.LOG_FILE.exists()
@@ -95,6 +101,8 @@ class TestCrashLogger:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
                 CrashLogger.log_exception(exc_type, exc_value, exc_traceback)
 
+            CrashLogger.flush()
+
             # Read and verify log content
             with open(CrashLogger.LOG_FILE, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -116,7 +124,7 @@ class TestCrashLogger:
         assert isinstance(path, str)
         assert "crash.log" in path
 
-    def test_clear_log(self, tmp_path):
+    def test_clear_log(self, tmp_path, sample_exc_info):
         """Test clearing the log file"""
         # Override log directory for testing
         original_dir = CrashLogger.LOG_DIR
@@ -127,12 +135,9 @@ class TestCrashLogger:
             CrashLogger.LOG_FILE = CrashLogger.LOG_DIR / "crash.log"
 
             # Create a log entry
-            try:
-                raise ValueError("Test error")
-            except Exception:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                CrashLogger.log_exception(exc_type, exc_value, exc_traceback)
+            CrashLogger.log_exception(*sample_exc_info)
 
+            CrashLogger.flush()
             assert CrashLogger.LOG_FILE.exists()
 
             # Clear the log
@@ -145,7 +150,7 @@ class TestCrashLogger:
             CrashLogger.LOG_DIR = original_dir
             CrashLogger.LOG_FILE = original_file
 
-    def test_log_rotation(self, tmp_path):
+    def test_log_rotation(self, tmp_path, sample_exc_info):
         """Test log rotation when file exceeds max size"""
         # Override log directory and max size for testing
         original_dir = CrashLogger.LOG_DIR
@@ -163,11 +168,9 @@ class TestCrashLogger:
                 f.write("X" * 150)  # Exceeds MAX_LOG_SIZE
 
             # Log a new exception (should trigger rotation)
-            try:
-                raise ValueError("New error after rotation")
-            except Exception:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                CrashLogger.log_exception(exc_type, exc_value, exc_traceback)
+            CrashLogger.log_exception(*sample_exc_info)
+
+            CrashLogger.flush()
 
             # Verify backup was created
             backup_file = CrashLogger.LOG_FILE.with_suffix('.log.old')
@@ -176,7 +179,8 @@ class TestCrashLogger:
             # Verify new log contains the new error
             with open(CrashLogger.LOG_FILE, 'r', encoding='utf-8') as f:
                 content = f.read()
-            assert "New error after rotation" in content
+            assert "Test error message" in content
+            assert "X" * 150 not in content
 
         finally:
             CrashLogger.LOG_DIR = original_dir
@@ -189,10 +193,24 @@ class TestCrashLogger:
 
         try:
             CrashLogger.install_exception_handler()
-            assert sys.excepthook == CrashLogger.log_exception
+            assert sys.excepthook == CrashLogger.handle_exception
         finally:
             sys.excepthook = original_excepthook
 
+    def test_exception_handler_writes_before_returning(self, tmp_path, monkeypatch, sample_exc_info):
+        """Test that the excepthook doesn't leave the entry queued"""
+        monkeypatch.setattr(CrashLogger, 'LOG_DIR', tmp_path / "test_logs")
+        monkeypatch.setattr(CrashLogger, 'LOG_FILE', CrashLogger.LOG_DIR / "crash.log")
+        flushed = []
+        original_flush = CrashLogger.flush.__func__
+        monkeypatch.setattr(CrashLogger, 'flush', classmethod(
+            lambda cls: (original_flush(cls), flushed.append(cls._queue.unfinished_tasks))))
+
+        CrashLogger.handle_exception(*sample_exc_info)
+
+        assert flushed == [0]
+        assert "Test error message" in CrashLogger.LOG_FILE.read_text(encoding='utf-8')
+
     def test_nested_exception_stack_trace(self, tmp_path):
         """Test that nested exceptions produce proper stack traces"""
         # Override log directory for testing
@@ -219,6 +237,8 @@ class TestCrashLogger:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
                 CrashLogger.log_exception(exc_type, exc_value, exc_traceback)
 
+            CrashLogger.flush()
+
             # Read and verify log content
             with open(CrashLogger.LOG_FILE, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -233,6 +253,85 @@ class TestCrashLogger:
             CrashLogger.LOG_DIR = original_dir
             CrashLogger.LOG_FILE = original_file
 
+    def test_log_written_on_writer_thread(self, tmp_path, monkeypatch):
+        """Test that the log file is written off the logging thread"""
+        import threading
+        monkeypatch.setattr(CrashLogger, 'LOG_DIR', tmp_path / "test_logs")
+        monkeypatch.setattr(CrashLogger, 'LOG_FILE', CrashLogger.LOG_DIR / "crash.log")
+        writer_threads = []
+        original_append = CrashLogger._append.__func__
+        monkeypatch.setattr(CrashLogger, '_append', classmethod(
+            lambda cls, log_file, data: (writer_threads.append(threading.current_thread()),
+                                         original_append(cls, log_file, data))))
+
+        try:
+            raise ValueError("Queued error")
+        except Exception:
+            CrashLogger.log_exception(*sys.exc_info())
+        CrashLogger.flush()
+
+        assert writer_threads and threading.current_thread() not in writer_threads
+        assert "Queued error" in CrashLogger.LOG_FILE.read_text(encoding='utf-8')
+
+    def test_log_size_tracked_without_stat(self, tmp_path, monkeypatch):
+        """Test that rotation uses the tracked size instead of a stat per entry"""
+        monkeypatch.setattr(CrashLogger, 'LOG_DIR', tmp_path / "test_logs")
+        monkeypatch.setattr(CrashLogger, 'LOG_FILE', CrashLogger.LOG_DIR / "crash.log")
+        monkeypatch.setattr(CrashLogger, 'MAX_LOG_SIZE', 1000)
+
+        for i in range(6):
+            try:
+                raise ValueError(f"Error {i}")
+            except Exception:
+                CrashLogger.log_exception(*sys.exc_info())
+            CrashLogger.flush()
+
+        backup_file = CrashLogger.LOG_FILE.with_suffix('.log.old')
+        assert backup_file.exists()
+        assert CrashLogger._bytes == CrashLogger.LOG_FILE.stat().st_size
+        assert "Error 5" in CrashLogger.LOG_FILE.read_text(encoding='utf-8')
+
+    def test_rotation_replaces_old_backup(self, tmp_path, monkeypatch, sample_exc_info):
+        """Test that rotating over an existing backup replaces it"""
+        monkeypatch.setattr(CrashLogger, 'LOG_DIR', tmp_path / "test_logs")
+        monkeypatch.setattr(CrashLogger, 'LOG_FILE', CrashLogger.LOG_DIR / "crash.log")
+        monkeypatch.setattr(CrashLogger, 'MAX_LOG_SIZE', 100)
+        CrashLogger.setup()
+        backup_file = CrashLogger.LOG_DIR / "crash.log.old"
+        backup_file.write_text("stale backup", encoding='utf-8')
+        CrashLogger.LOG_FILE.write_text("X" * 150, encoding='utf-8')
+
+        CrashLogger.log_exception(*sample_exc_info)
+        CrashLogger.flush()
+
+        assert backup_file.read_text(encoding='utf-8') == "X" * 150
+        assert "Test error message" in CrashLogger.LOG_FILE.read_text(encoding='utf-8')
+
+    def test_repeated_traceback_formatted_once(self, monkeypatch):
+        """Test that an identical exception reuses its formatted stack trace"""
+        import traceback
+        monkeypatch.setattr(CrashLogger, '_tb_cache', {})
+        calls = []
+        original_format = traceback.format_exception
+        monkeypatch.setattr(traceback, 'format_exception',
+                            lambda *args: calls.append(args) or original_format(*args))
+
+        traces = []
+        for i in range(3):
+            try:
+                raise ValueError("Same error")
+            except Exception:
+                traces.append(CrashLogger._format_traceback(*sys.exc_info()))
+        try:
+            raise ValueError("Other error")
+        except Exception:
+            other = CrashLogger._format_traceback(*sys.exc_info())
+
+        assert len(calls) == 2
+        assert traces[0] == traces[2]
+        assert "Same error" in traces[0]
+        assert "Other error" in other
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,51 +1,54 @@
-import os
 from pathlib import Path
 import pytest
 from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtTest import QTest
 from PyQt6.QtGui import QKeySequence
+from PyQt6.QtWidgets import QMenu
 
 from ui.main_window import FileTab
 
-@pytest.fixture
-def temp_dir(tmp_path):
+@pytest.fixture(scope="module")
+def shared_tab(qapp, tmp_path_factory):
+    """One FileTab for the whole module; building a tab dominates these tests"""
+    temp_dir = tmp_path_factory.mktemp("delete_shortcuts")
     # Create temporary files
-    (tmp_path / "file1.txt").write_text("one")
-    (tmp_path / "file2.log").write_text("two")
-    return tmp_path
+    (temp_dir / "file1.txt").write_text("one")
+    (temp_dir / "file2.log").write_text("two")
+    tab = FileTab(str(temp_dir))
+    # Stop background timers to avoid interference
+    if hasattr(tab, '_poll_timer'):
+        tab._poll_timer.stop()
+    if hasattr(tab, '_watch_refresh_timer'):
+        tab._watch_refresh_timer.stop()
+    qapp.processEvents()
+    return tab
+
+@pytest.fixture
+def tab(shared_tab):
+    """The shared FileTab with nothing selected"""
+    sel_model = shared_tab.file_list.selectionModel()
+    if sel_model:
+        sel_model.clearSelection()
+    return shared_tab
 
 def _select_two(tab: FileTab):
     # Select both items in the file list
     fl = tab.file_list
     assert fl.select_item_by_name("file1.txt")
     # Select second while keeping first selected
-    # Find second item index in source model
-    for row in range(fl.source_model.rowCount()):
-        item = fl.source_model.item(row, 0)
-        if not item:
-            continue
-        p = item.data(Qt.ItemDataRole.UserRole)
-        if os.path.basename(p) == "file2.log":
-            src_index = fl.source_model.index(row, 0)
-            proxy_index = fl.proxy_model.mapFromSource(src_index)
-            sel_model = fl.selectionModel()
-            assert sel_model is not None
-            # Extend selection to include second item
-            sel_model.select(proxy_index, sel_model.SelectionFlag.Select | sel_model.SelectionFlag.Rows)  # type: ignore[attr-defined]
-            break
+    row = fl.row_for_name("file2.log")
+    assert row >= 0
+    src_index = fl.source_model.index(row, 0)
+    proxy_index = fl.proxy_model.mapFromSource(src_index)
+    sel_model = fl.selectionModel()
+    assert sel_model is not None
+    # Extend selection to include second item
+    sel_model.select(proxy_index, sel_model.SelectionFlag.Select | sel_model.SelectionFlag.Rows)  # type: ignore[attr-defined]
     selected = tab.file_list.get_selected_items()
     assert len(selected) == 2
     return selected
 
-def test_delete_shortcuts_trash_and_permanent(qapp, temp_dir):
-    tab = FileTab(str(temp_dir))
-    # Stop background timers to avoid interference
-    if hasattr(tab, '_poll_timer'):
-        tab._poll_timer.stop()
-    if hasattr(tab, '_watch_refresh_timer'):
-        tab._watch_refresh_timer.stop()
-    qapp.processEvents()
-
+def test_delete_shortcuts_trash_and_permanent(tab):
     selected = _select_two(tab)
 
     trashed_calls = []
@@ -73,14 +76,7 @@ def test_delete_shortcuts_trash_and_permanent(qapp, temp_dir):
     QTest.keyClick(tab.file_list, Qt.Key.Key_Delete, Qt.KeyboardModifier.ControlModifier)  # type: ignore[arg-type]
     assert set(deleted_calls) == set(selected)
 
-def test_delete_shortcut_no_selection(qapp, temp_dir):
-    tab = FileTab(str(temp_dir))
-    if hasattr(tab, '_poll_timer'):
-        tab._poll_timer.stop()
-    if hasattr(tab, '_watch_refresh_timer'):
-        tab._watch_refresh_timer.stop()
-    qapp.processEvents()
-
+def test_delete_shortcut_no_selection(tab):
     trashed_calls = []
     try:
         tab.file_list.trash_requested.disconnect()
@@ -96,26 +92,21 @@ def test_delete_shortcut_no_selection(qapp, temp_dir):
     QTest.keyClick(tab.file_list, Qt.Key.Key_Delete)  # type: ignore[arg-type]
     assert trashed_calls == []
 
-def test_context_menu_actions_have_shortcuts(qapp, temp_dir, monkeypatch):
-    tab = FileTab(str(temp_dir))
-    qapp.processEvents()
+def test_context_menu_actions_have_shortcuts(tab, monkeypatch):
     fl = tab.file_list
 
     captured_menus = []
-    orig_init = __import__('PyQt6').QtWidgets.QMenu.__init__  # type: ignore
-    orig_exec = __import__('PyQt6').QtWidgets.QMenu.exec  # type: ignore
-    from PyQt6.QtWidgets import QMenu  # type: ignore
 
-    def tracking_init(self, *args, **kwargs):  # type: ignore
-        orig_init(self, *args, **kwargs)
-        captured_menus.append(self)
+    class TrackingMenu(QMenu):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            captured_menus.append(self)
 
-    def fake_exec(self, *args, **kwargs):  # type: ignore
-        # Do not block; just return
-        return None
+        def exec(self, *args, **kwargs):
+            # Do not block; just return
+            return None
 
-    monkeypatch.setattr(QMenu, "__init__", tracking_init)
-    monkeypatch.setattr(QMenu, "exec", fake_exec)
+    monkeypatch.setattr("ui.main_window.QMenu", TrackingMenu)
 
     # Single selection
     assert fl.select_item_by_name("file1.txt")
@@ -0,0 +1,77 @@
+"""
+Unit tests for FileOperations.get_file_info
+"""
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from core.file_operations import FileOperations
+
+
+def test_file_info_for_regular_file(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("hello")
+    os.chmod(f, 0o640)
+
+    info = FileOperations.get_file_info(str(f))
+
+    assert info['name'] == "a.txt"
+    assert info['is_file'] and not info['is_dir'] and not info['is_symlink']
+    assert info['size'] == 5
+    assert info['permissions'] == "-rw-r-----"
+    assert info['owner_read'] and info['owner_write'] and not info['owner_execute']
+    assert info['group_read'] and not info['group_write']
+    assert not info['other_read']
+    assert stat.S_IMODE(info['mode']) == 0o640
+
+
+def test_file_info_for_directory_symlink(tmp_path):
+    target = tmp_path / "dir"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+
+    info = FileOperations.get_file_info(str(link))
+
+    assert info['is_dir'] and not info['is_file']
+    assert info['is_symlink']
+
+
+def test_file_info_missing_and_dangling(tmp_path):
+    dangling = tmp_path / "dangling"
+    dangling.symlink_to(tmp_path / "missing")
+
+    assert FileOperations.get_file_info(str(tmp_path / "missing")) is None
+    assert FileOperations.get_file_info(str(dangling)) is None
+
+
+def test_executable_type_cached_until_modified(tmp_path):
+    f = tmp_path / "tool"
+    f.write_bytes(b"\x7fELF")
+
+    with patch.object(FileOperations, '_is_gui_executable', return_value=False) as is_gui:
+        assert FileOperations.get_executable_type(str(f)) == 'console'
+        assert FileOperations.get_executable_type(str(f)) == 'console'
+        assert is_gui.call_count == 1
+
+        f.write_bytes(b"#!/bin/sh\n")
+        assert FileOperations.get_executable_type(str(f)) == 'script'
+
+    assert FileOperations.get_executable_type(str(tmp_path)) is None
+    assert FileOperations.get_executable_type(str(tmp_path / "missing")) is None
+
+
+def test_login_shell_is_console_without_inspection(tmp_path):
+    shell = tmp_path / "myshell"
+    shell.write_bytes(b"#!/bin/sh\n")
+
+    with patch('core.file_operations._login_shells', return_value=frozenset({str(shell)})), \
+            patch.object(FileOperations, '_is_script') as is_script:
+        assert FileOperations.get_executable_type(str(shell)) == 'console'
+
+    assert is_script.call_count == 0
@@ -46,8 +46,8 @@ def test_folder_size_worker_counts_files(qtbot, tmp_path):
     def on_done(count):
         final_count[0] = count
 
-    worker.file_count_progress.connect(on_progress)
-    worker.file_count_done.connect(on_done)
+    worker.signals.progress.connect(lambda _total, count: on_progress(count))
+    worker.signals.done.connect(lambda _total, count: on_done(count))
 
     # Run worker
     worker.run()
@@ -75,7 +75,7 @@ def test_folder_size_worker_handles_empty_folder(qtbot, tmp_path):
     def on_done(count):
         final_count[0] = count
 
-    worker.file_count_done.connect(on_done)
+    worker.signals.done.connect(lambda _total, count: on_done(count))
     worker.run()
 
     assert final_count[0] == 0, f"Expected 0 files in empty folder, got {final_count[0]}"
@@ -97,7 +97,7 @@ def test_folder_size_worker_counts_only_files(qtbot, tmp_path):
     def on_done(count):
         final_count[0] = count
 
-    worker.file_count_done.connect(on_done)
+    worker.signals.done.connect(lambda _total, count: on_done(count))
     worker.run()
 
     # Should count only 2 files, not the 3 directories
@@ -120,7 +120,7 @@ def test_folder_size_worker_stops_counting_on_stop(qtbot, tmp_path):
     def on_done(count):
         final_count[0] = count
 
-    worker.file_count_done.connect(on_done)
+    worker.signals.done.connect(lambda _total, count: on_done(count))
     worker.run()
 
     # Should have stopped early, not counted all 100 files
@@ -189,7 +189,7 @@ def test_file_count_plural_singular(qtbot, tmp_path):
     def on_done(count):
         final_count[0] = count
 
-    worker.file_count_done.connect(on_done)
+    worker.signals.done.connect(lambda _total, count: on_done(count))
     worker.run()
 
     assert final_count[0] == 1
@@ -206,7 +206,175 @@ def test_file_count_plural_singular(qtbot, tmp_path):
     def on_done2(count):
         final_count2[0] = count
 
-    worker2.file_count_done.connect(on_done2)
+    worker2.signals.done.connect(lambda _total, count: on_done2(count))
     worker2.run()
 
     assert final_count2[0] == 2
+
+
+def test_folder_size_worker_skips_symlinks(qtbot, tmp_path):
+    """Test that FolderSizeWorker sums regular file sizes and ignores symlinks"""
+    (tmp_path / "a.bin").write_bytes(b"x" * 100)
+    subdir = tmp_path / "sub"
+    subdir.mkdir()
+    (subdir / "b.bin").write_bytes(b"x" * 50)
+    (tmp_path / "link_to_file").symlink_to(tmp_path / "a.bin")
+    (tmp_path / "link_to_dir").symlink_to(subdir)
+
+    worker = FolderSizeWorker(str(tmp_path))
+    results = {}
+    worker.signals.done.connect(lambda total, count: results.update(size=total, count=count))
+    worker.run()
+
+    assert results == {'size': 150, 'count': 2}
+
+
+def test_folder_size_worker_throttles_progress(qtbot, tmp_path, monkeypatch):
+    """Test that small files don't trigger a progress emission per clock check"""
+    for i in range(10):
+        (tmp_path / f"file{i}.txt").write_text("x")
+
+    monkeypatch.setattr(FolderSizeWorker, 'TIME_CHECK_INTERVAL', 1)
+    worker = FolderSizeWorker(str(tmp_path))
+    progress = []
+    worker.signals.progress.connect(lambda total, _count: progress.append(total))
+    worker.run()
+
+    # Only the initial emission: neither the byte step nor the max interval is reached
+    assert progress == [1]
+
+
+def test_folder_size_worker_skips_snapshots(qtbot, tmp_path):
+    """Test that snapshot directories are not descended into"""
+    (tmp_path / "a.bin").write_bytes(b"x" * 10)
+    snapshots = tmp_path / ".snapshots"
+    snapshots.mkdir()
+    (snapshots / "copy.bin").write_bytes(b"x" * 10)
+
+    worker = FolderSizeWorker(str(tmp_path))
+    results = {}
+    worker.signals.done.connect(lambda total, count: results.update(size=total, count=count))
+    worker.run()
+
+    assert results == {'size': 10, 'count': 1}
+
+
+# 1x1 transparent GIF
+_GIF = (b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+        b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;')
+
+
+def test_dialogs_share_one_spinner(qapp, qtbot, tmp_path, monkeypatch):
+    """Test that folder dialogs share one spinner movie and stop it when all are done"""
+    from PyQt6.QtGui import QMovie
+    gif = tmp_path / "spinner.gif"
+    gif.write_bytes(_GIF)
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    movie = QMovie(str(gif))
+    monkeypatch.setattr(PropertiesDialog, '_spinner', movie)
+    monkeypatch.setattr(PropertiesDialog, '_spinner_users', 0)
+
+    first = PropertiesDialog(str(folder))
+    second = PropertiesDialog(str(folder))
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    assert first.spinner_movie is movie
+    assert second.spinner_movie is movie
+    assert first.file_count_spinner_label.movie() is movie
+
+    first.show()
+    second.show()
+    qtbot.waitUntil(lambda: PropertiesDialog._spinner_users == 0, timeout=2000)
+    assert movie.state() == QMovie.MovieState.NotRunning
+
+
+def test_folder_size_worker_stops_mid_walk(qtbot, tmp_path, monkeypatch):
+    """Test that a stop request during the walk ends it at the next clock check"""
+    for i in range(10):
+        (tmp_path / f"file{i}.txt").write_text("x")
+
+    monkeypatch.setattr(FolderSizeWorker, 'TIME_CHECK_INTERVAL', 1)
+    worker = FolderSizeWorker(str(tmp_path))
+    worker.signals.progress.connect(lambda *_: worker.stop())
+    final_count = []
+    worker.signals.done.connect(lambda _total, count: final_count.append(count))
+    worker.run()
+
+    assert final_count == [2]
+
+
+def test_spinner_starts_only_when_shown(qapp, qtbot, tmp_path, monkeypatch):
+    """Test that the spinner doesn't run for a dialog that isn't shown yet"""
+    from PyQt6.QtGui import QMovie
+    gif = tmp_path / "spinner.gif"
+    gif.write_bytes(_GIF)
+    movie = QMovie(str(gif))
+    monkeypatch.setattr(PropertiesDialog, '_spinner', movie)
+    monkeypatch.setattr(PropertiesDialog, '_spinner_users', 0)
+    monkeypatch.setattr(PropertiesDialog, 'start_folder_size_calculation', lambda self: None)
+
+    dialog = PropertiesDialog(str(tmp_path))
+    qtbot.addWidget(dialog)
+    assert movie.state() == QMovie.MovieState.NotRunning
+
+    dialog.show()
+    assert movie.state() == QMovie.MovieState.Running
+
+    dialog.close()
+    assert movie.state() == QMovie.MovieState.NotRunning
+    assert PropertiesDialog._spinner_users == 0
+
+
+def test_folder_size_worker_parallel_walk_on_network_mount(qtbot, tmp_path, monkeypatch):
+    """Test that the threaded walk used on network mounts gives the serial result"""
+    for d in range(4):
+        subdir = tmp_path / f"dir{d}" / "nested"
+        subdir.mkdir(parents=True)
+        (subdir / "a.bin").write_bytes(b"x" * 10)
+        (tmp_path / f"dir{d}" / "b.bin").write_bytes(b"x" * 5)
+    (tmp_path / "link_to_dir").symlink_to(tmp_path / "dir0")
+    (tmp_path / ".snapshots").mkdir()
+    (tmp_path / ".snapshots" / "copy.bin").write_bytes(b"x" * 10)
+
+    serial = {}
+    worker = FolderSizeWorker(str(tmp_path))
+    worker.signals.done.connect(lambda total, count: serial.update(size=total, count=count))
+    worker.run()
+
+    parallel = {}
+    monkeypatch.setattr('ui.properties_dialog.is_on_network_mount', lambda path: True)
+    worker = FolderSizeWorker(str(tmp_path))
+    worker.signals.done.connect(lambda total, count: parallel.update(size=total, count=count))
+    worker.run()
+
+    assert serial == {'size': 60, 'count': 8}
+    assert parallel == serial
+
+
+def test_reject_stops_folder_scan(qapp, qtbot, tmp_path, monkeypatch):
+    """Test that dismissing the dialog with Esc (reject) stops a running walk"""
+    import threading
+    import time
+    from PyQt6.QtCore import QThreadPool
+
+    started = threading.Event()
+
+    def slow_run(self):
+        started.set()
+        # Bounded, so a missing stop fails the test instead of hanging it
+        deadline = time.monotonic() + 5
+        while not self._stop and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    monkeypatch.setattr(FolderSizeWorker, 'run', slow_run)
+    dialog = PropertiesDialog(str(tmp_path))
+    qtbot.addWidget(dialog)
+    dialog.show()
+    assert started.wait(2)
+
+    dialog.reject()
+
+    assert dialog.folder_size_worker._stop
+    assert QThreadPool.globalInstance().waitForDone(2000)
@@ -0,0 +1,251 @@
+"""
+Unit tests for PathNavigator path segment buttons
+"""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from ui.path_navigator import PathNavigator
+
+
+def _segment_texts(nav: PathNavigator):
+    return [button.text() for button, _ in nav._segment_buttons]
+
+
+def _completions(qtbot, nav: PathNavigator, text):
+    """Complete text in nav once its directory is loaded; return the candidates"""
+    nav.update_completer(text)
+    nav._completer_timer.timeout.emit()
+    nav.completer.setCompletionPrefix(text)
+    qtbot.waitUntil(lambda: nav.completer.completionCount() > 0, timeout=5000)
+    completions = []
+    for row in range(nav.completer.completionCount()):
+        nav.completer.setCurrentRow(row)
+        completions.append(nav.completer.currentCompletion())
+    return completions
+
+
+class TestPathSegments:
+    """Tests for the incremental path segment display"""
+
+    def test_segments_match_path(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.set_path(tmp_path)
+
+        assert _segment_texts(nav) == list(tmp_path.resolve().parts)
+        assert nav.button_layout.count() == len(tmp_path.resolve().parts)
+
+    def test_sibling_navigation_reuses_common_prefix(self, qapp, tmp_path):
+        (tmp_path / 'a').mkdir()
+        (tmp_path / 'b').mkdir()
+        nav = PathNavigator()
+        nav.set_path(tmp_path / 'a')
+        before = [button for button, _ in nav._segment_buttons]
+
+        nav.set_path(tmp_path / 'b')
+        after = [button for button, _ in nav._segment_buttons]
+
+        assert after[:-1] == before[:-1]
+        assert after[-1] is not before[-1]
+        assert after[-1].text() == 'b'
+        assert nav.button_layout.count() == len(after)
+        assert nav.button_layout.isEnabled()
+        assert nav.button_container.updatesEnabled()
+
+    def test_only_last_segment_is_current(self, qapp, tmp_path):
+        (tmp_path / 'a').mkdir()
+        nav = PathNavigator()
+        nav.set_path(tmp_path / 'a')
+        nav.set_path(tmp_path)
+
+        roles = [button.property("pathRole") for button, _ in nav._segment_buttons]
+        assert roles[-1] == "current"
+        assert all(role == "segment" for role in roles[:-1])
+
+    def test_segment_click_navigates_and_selects_child(self, qapp, tmp_path):
+        (tmp_path / 'a').mkdir()
+        nav = PathNavigator()
+        nav.set_path(tmp_path / 'a')
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        parent_button, _ = nav._segment_buttons[-2]
+        parent_button.click()
+
+        assert emitted == [str(tmp_path.resolve())]
+        assert nav.take_selection_hints() == ['a']
+
+    def test_reused_segment_selects_new_child(self, qapp, tmp_path):
+        (tmp_path / 'a').mkdir()
+        (tmp_path / 'b').mkdir()
+        nav = PathNavigator()
+        nav.set_path(tmp_path / 'a')
+        nav.set_path(tmp_path / 'b')
+
+        parent_button, _ = nav._segment_buttons[-2]
+        parent_button.click()
+
+        assert nav.take_selection_hints() == ['b']
+
+    def test_current_segment_click_is_noop(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.set_path(tmp_path)
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        current_button, _ = nav._segment_buttons[-1]
+        current_button.click()
+
+        assert emitted == []
+
+    def test_set_path_resolves_symlinks(self, qapp, tmp_path):
+        (tmp_path / 'real').mkdir()
+        (tmp_path / 'link').symlink_to(tmp_path / 'real')
+        nav = PathNavigator()
+
+        nav.set_path(tmp_path / 'link')
+
+        assert nav.current_path == (tmp_path / 'real').resolve()
+
+    def test_segment_navigation_skips_resolve(self, qapp, tmp_path):
+        (tmp_path / 'a').mkdir()
+        nav = PathNavigator()
+        nav.set_path(tmp_path / 'a')
+
+        with patch('pathlib.Path.resolve', side_effect=AssertionError("resolve called")):
+            parent_button, _ = nav._segment_buttons[-2]
+            parent_button.click()
+
+        assert nav.current_path == tmp_path.resolve()
+
+    def test_stylesheet_applied_to_container_only(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.set_path(tmp_path)
+
+        assert nav.button_container.styleSheet() == PathNavigator._SEGMENT_STYLESHEET
+        assert all(button.styleSheet() == "" for button, _ in nav._segment_buttons)
+
+
+class TestCompleterModel:
+    """Tests for the completer filesystem model"""
+
+    def test_navigators_share_one_fs_model(self, qapp):
+        first = PathNavigator()
+        second = PathNavigator()
+
+        assert first.fs_model is second.fs_model
+        assert first.completer is not second.completer
+        assert first.completer.model() is second.completer.model()
+
+    def test_warm_completer_cache_fetches_directory(self, qapp, tmp_path):
+        model = PathNavigator._shared_fs_model()
+        with patch.object(model, 'fetchMore') as fetch_more:
+            PathNavigator.warm_completer_cache(tmp_path)
+
+        assert fetch_more.call_count == 1
+        assert fetch_more.call_args[0][0] == model.index(str(tmp_path))
+
+    def test_completer_update_is_debounced(self, qapp, tmp_path):
+        with patch.object(PathNavigator, '_do_update_completer') as do_update:
+            nav = PathNavigator()
+            for text in ('/t', '/tm', '/tmp'):
+                nav.update_completer(text)
+            assert do_update.call_count == 0
+            assert nav._completer_timer.isActive()
+            assert nav._pending_completer_text == '/tmp'
+
+            nav._completer_timer.timeout.emit()
+
+        assert do_update.call_count == 1
+
+    def test_completions_follow_each_typed_prefix(self, qapp, qtbot, tmp_path):
+        alpha = tmp_path / 'alpha'
+        alpha.mkdir()
+        (alpha / 'project').mkdir()
+        (alpha / 'other').mkdir()
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+
+        assert _completions(qtbot, nav, str(alpha / 'pro')) == [str(alpha / 'project')]
+        assert _completions(qtbot, nav, str(alpha / 'o')) == [str(alpha / 'other')]
+        assert _completions(qtbot, nav, str(tmp_path / 'al')) == [str(alpha)]
+
+        # Typing in one navigator doesn't narrow another one's completions
+        other = PathNavigator()
+        other.enter_edit_mode()
+        assert _completions(qtbot, other, str(alpha / 'ot')) == [str(alpha / 'other')]
+
+
+class TestPathEdit:
+    """Tests for confirming a typed path"""
+
+    def test_confirm_existing_path_navigates(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        nav.path_edit.setText(str(tmp_path))
+        nav.confirm_path_edit()
+
+        assert emitted == [str(tmp_path.resolve())]
+        assert not nav.edit_mode
+
+    def test_confirm_missing_path_stays_in_edit_mode(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        nav.path_edit.setText(str(tmp_path / 'missing'))
+        nav.confirm_path_edit()
+
+        assert emitted == []
+        assert nav.edit_mode
+        assert nav.path_edit.styleSheet()
+
+        nav.path_edit.setText(str(tmp_path))
+        assert nav.path_edit.styleSheet() == ""
+
+    def test_unreadable_path_stays_in_edit_mode(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        nav.path_edit.setText(str(tmp_path / 'locked' / 'inner'))
+        with patch('pathlib.Path.exists', side_effect=PermissionError(13, "Permission denied")):
+            nav.confirm_path_edit()
+
+        assert emitted == []
+        assert nav.edit_mode
+        assert nav.path_edit.styleSheet()
+
+    def test_network_path_is_checked_in_background(self, qapp, qtbot, tmp_path):
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+        nav.path_edit.setText(str(tmp_path))
+
+        with patch('ui.path_navigator.is_on_network_mount', return_value=True):
+            with qtbot.waitSignal(nav.path_changed, timeout=5000) as blocker:
+                nav.confirm_path_edit()
+
+        assert blocker.args == [str(tmp_path.resolve())]
+        assert not nav.edit_mode
+
+    def test_stale_background_check_is_ignored(self, qapp, tmp_path):
+        nav = PathNavigator()
+        nav.enter_edit_mode()
+        emitted = []
+        nav.path_changed.connect(emitted.append)
+
+        stale = nav._path_check_generation
+        nav.path_edit.setText(str(tmp_path / 'other'))
+        nav._on_path_check_finished(stale, tmp_path)
+
+        assert emitted == []
+        assert nav.edit_mode
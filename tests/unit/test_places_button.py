@@ -139,3 +139,25 @@ class TestPlacesButton:
         root_place = next((p for p in places if p.name == 'Root'), None)
         assert root_place is not None
         assert root_place.icon == 'drive-harddisk'
+
+    def test_refresh_places_keeps_menu_when_unchanged(self, qapp):
+        """Test that refresh_places does not rebuild the menu if places are unchanged"""
+        button = PlacesButton()
+        initial_menu = button.menu()
+
+        button.refresh_places()
+
+        assert button.menu() is initial_menu
+
+    def test_refresh_places_rebuilds_menu_when_changed(self, qapp):
+        """Test that refresh_places rebuilds the menu when places change"""
+        button = PlacesButton()
+        initial_menu = button.menu()
+
+        with patch.object(button.places_manager, 'get_all_places',
+                          return_value=[PlaceItem('Only', '/', 'folder', builtin=True)]):
+            button.refresh_places()
+
+        new_menu = button.menu()
+        assert new_menu is not initial_menu
+        assert [a.text() for a in new_menu.actions()] == ['Only']
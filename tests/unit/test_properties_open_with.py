@@ -0,0 +1,120 @@
+"""
+Unit tests for the Open With section of the Properties dialog
+"""
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from ui.properties_dialog import PropertiesDialog
+from core.application_manager import ApplicationManager
+
+
+def _app(name, path):
+    app = MagicMock()
+    app.name = name
+    app.path = path
+    return app
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    f = tmp_path / "notes.txt"
+    f.write_text("content")
+    return f
+
+
+@pytest.fixture
+def apps():
+    default = _app("Kate", "/apps/kate.desktop")
+    other = _app("Gedit", "/apps/gedit.desktop")
+    with patch.object(ApplicationManager, 'get_default_application', return_value=default) as get_default, \
+         patch.object(ApplicationManager, 'get_ranked_applications_for_file', return_value=[default, other]):
+        yield get_default, default, other
+
+
+def test_open_with_is_populated_after_show(qapp, qtbot, text_file, apps):
+    get_default, default, other = apps
+    dialog = PropertiesDialog(str(text_file))
+    qtbot.addWidget(dialog)
+
+    assert get_default.call_count == 0
+    assert not dialog.open_with_combo.isEnabled()
+
+    dialog.show()
+    qtbot.waitUntil(lambda: dialog.open_with_combo.isEnabled(), timeout=2000)
+
+    items = [dialog.open_with_combo.itemText(i) for i in range(dialog.open_with_combo.count())]
+    assert items == ["Kate (default)", "Gedit"]
+    assert get_default.call_count == 1
+
+
+def test_selected_application_populates_on_demand(qapp, qtbot, text_file, apps):
+    _, default, other = apps
+    dialog = PropertiesDialog(str(text_file))
+    qtbot.addWidget(dialog)
+
+    assert dialog.get_selected_application() is default
+
+
+def test_selected_application_by_name(qapp, qtbot, text_file, apps):
+    _, default, other = apps
+    dialog = PropertiesDialog(str(text_file))
+    qtbot.addWidget(dialog)
+    dialog.ensure_open_with_populated()
+
+    dialog.open_with_combo.setCurrentText("Gedit")
+
+    assert dialog.get_selected_application() is other
+
+
+def test_repopulate_reuses_ranked_applications(qapp, qtbot, text_file, apps):
+    get_default, default, other = apps
+    dialog = PropertiesDialog(str(text_file))
+    qtbot.addWidget(dialog)
+
+    with patch.object(ApplicationManager, 'get_ranked_applications_for_file',
+                      return_value=[default, other]) as get_ranked:
+        dialog.populate_open_with_applications()
+        get_default.return_value = other
+        dialog.populate_open_with_applications()
+
+    assert get_ranked.call_count == 1
+    assert get_default.call_count == 2
+    assert dialog.open_with_combo.itemText(0) == "Gedit (default)"
+
+
+def test_default_change_reranks_applications(qapp, qtbot, text_file, apps):
+    get_default, default, other = apps
+    dialog = PropertiesDialog(str(text_file))
+    qtbot.addWidget(dialog)
+    dialog.populate_open_with_applications()
+    dialog.open_with_combo.setCurrentText("Gedit")
+
+    with patch.object(ApplicationManager, 'set_default_application_for_file', return_value=True), \
+         patch.object(ApplicationManager, 'get_ranked_applications_for_file',
+                      return_value=[other, default]) as get_ranked, \
+         patch('ui.properties_dialog.QMessageBox.information'):
+        get_default.return_value = other
+        dialog.apply_changes()
+
+    assert get_ranked.call_count == 1
+    assert dialog.available_applications == [other, default]
+    items = [dialog.open_with_combo.itemText(i) for i in range(dialog.open_with_combo.count())]
+    assert items == ["Gedit (default)", "Kate"]
+
+
+def test_mime_type_is_looked_up_after_show(qapp, qtbot, text_file, apps):
+    with patch.object(ApplicationManager, 'get_mime_type', return_value='text/plain') as get_mime:
+        dialog = PropertiesDialog(str(text_file))
+        qtbot.addWidget(dialog)
+        assert get_mime.call_count == 0
+        assert dialog.file_info['mime_type'] is None
+
+        dialog.show()
+        qtbot.waitUntil(lambda: dialog.open_with_combo.isEnabled(), timeout=2000)
+
+    assert get_mime.call_count == 1
+    assert dialog.mime_type_label.text() == 'text/plain'
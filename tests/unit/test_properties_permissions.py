@@ -0,0 +1,59 @@
+"""
+Unit tests for the Permissions tab of the Properties dialog
+"""
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from ui.properties_dialog import PropertiesDialog
+from core.file_operations import FileOperations
+
+
+def test_apply_permissions_updates_info_without_restat(qapp, qtbot, tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("content")
+    os.chmod(f, 0o644)
+
+    dialog = PropertiesDialog(str(f))
+    qtbot.addWidget(dialog)
+    dialog.group_write_cb.setChecked(True)
+    dialog.other_read_cb.setChecked(False)
+
+    with patch.object(FileOperations, 'get_file_info', side_effect=AssertionError("re-stat")):
+        dialog.apply_permissions()
+
+    assert stat.S_IMODE(os.stat(f).st_mode) == 0o660
+    assert dialog.file_info['permissions'] == "-rw-rw----"
+    assert dialog.file_info['group_write']
+    assert not dialog.file_info['other_read']
+
+
+def test_apply_permissions_updates_current_permissions_label(qapp, qtbot, tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("content")
+    os.chmod(f, 0o644)
+
+    dialog = PropertiesDialog(str(f))
+    qtbot.addWidget(dialog)
+    dialog.owner_execute_cb.setChecked(True)
+    dialog.apply_permissions()
+
+    assert dialog._perm_display_label.text() == "-rwxr--r--"
+
+
+def test_permission_checkboxes_reflect_mode(qapp, qtbot, tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("content")
+    os.chmod(f, 0o751)
+
+    dialog = PropertiesDialog(str(f))
+    qtbot.addWidget(dialog)
+
+    checked = [cb.isChecked() for _, cb, _ in dialog._perm_table]
+    assert checked == [True, True, True, True, False, True, False, False, True]
+    assert [bit for _, _, bit in dialog._perm_table] == [0o400, 0o200, 0o100, 0o040, 0o020, 0o010, 0o004, 0o002, 0o001]
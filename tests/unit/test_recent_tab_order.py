@@ -0,0 +1,64 @@
+"""
+Unit tests for MainWindow recently-used tab order bookkeeping (Ctrl+Tab)
+"""
+import sys
+
+sys.path.insert(0, 'src')
+
+from ui.main_window import MainWindow
+
+
+def _order(window):
+    return list(window.recent_tab_order)
+
+
+def test_switching_tabs_moves_index_to_front(window):
+    window.add_new_tab()
+    window.add_new_tab()
+    assert _order(window) == [2, 1, 0]
+
+    window.tab_widget.setCurrentIndex(0)
+    assert _order(window) == [0, 2, 1]
+
+
+def test_history_is_capped(window):
+    for index in range(15):
+        window.update_recent_tab_order(index)
+
+    assert _order(window) == list(range(14, 14 - MainWindow.RECENT_TAB_HISTORY, -1))
+
+
+def test_close_tab_shifts_later_indices(window):
+    window.add_new_tab()
+    window.add_new_tab()
+    window.tab_widget.setCurrentIndex(0)
+    assert _order(window) == [0, 2, 1]
+
+    window.update_recent_tab_order_on_close(1)
+    assert _order(window) == [0, 1]
+
+
+def test_tab_moved_remaps_indices(window):
+    for index in [3, 2, 1, 0]:
+        window.update_recent_tab_order(index)
+    assert _order(window)[:4] == [0, 1, 2, 3]
+
+    window.on_tab_moved(0, 2)
+    assert _order(window)[:4] == [2, 0, 1, 3]
+
+
+def test_switch_to_recent_tab_picks_previous(window):
+    window.add_new_tab()
+    window.add_new_tab()
+    window.tab_widget.setCurrentIndex(0)
+
+    window.switch_to_recent_tab()
+    assert window.tab_widget.currentIndex() == 2
+
+
+def test_tab_moved_left_remaps_indices(window):
+    for index in [3, 2, 1, 0]:
+        window.update_recent_tab_order(index)
+
+    window.on_tab_moved(3, 1)
+    assert _order(window)[:4] == [0, 2, 3, 1]
@@ -0,0 +1,23 @@
+"""
+Unit tests for the rename dialog's preselected name span
+"""
+import sys
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from ui.rename_dialog import _selection_span
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ("", (0, 0)),
+    ("notes", (0, 5)),
+    ("notes.txt", (0, 5)),
+    ("backup.tar.gz", (0, 6)),
+    ("photos.TAR.XZ", (0, 6)),
+    (".bashrc", (0, 7)),
+    (".config.bak", (0, 7)),
+])
+def test_selection_span(filename, expected):
+    assert _selection_span(filename) == expected
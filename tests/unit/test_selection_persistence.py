@@ -70,3 +70,18 @@ def test_navigation_without_hints_defaults_to_first_item(qapp):
         # Without hints the first entry should be selected (directories first, alphabetical)
         expected_first = sorted([p.name for p in root.iterdir()], key=lambda n: (not (root / n).is_dir(), n.lower()))[0]
         assert _current_item_name(tab) == expected_first
+
+
+def test_row_for_name_follows_refresh(qapp, tmp_path):
+    _populate_demo_tree(tmp_path)
+    tab = FileTab(str(tmp_path))
+    tab.navigate_to(str(tmp_path))
+    fl = tab.file_list
+
+    row = fl.row_for_name('Downloads')
+    assert fl.source_model.item(row, 0).text() == 'Downloads'
+    assert fl.row_for_name('Music') == -1
+
+    (tmp_path / 'Music').mkdir()
+    fl.refresh()
+    assert fl.source_model.item(fl.row_for_name('Music'), 0).text() == 'Music'
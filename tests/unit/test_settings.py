@@ -0,0 +1,108 @@
+"""
+Unit tests for Settings persistence
+"""
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from utils.settings import Settings
+
+
+@pytest.fixture
+def settings(isolated_settings):
+    """A fresh Settings singleton storing its file under tmp_path"""
+    instance = Settings()
+    yield instance
+    if instance._flush_timer is not None:
+        instance._flush_timer.stop()
+    if instance._journal is not None:
+        instance._journal.close()
+
+
+def _read(settings):
+    with open(settings.config_file) as f:
+        return json.load(f)
+
+
+def test_settings_is_shared(settings):
+    assert Settings() is settings
+
+
+def test_set_is_journaled_after_debounce(qapp, qtbot, settings):
+    settings.set("sort_column", 1)
+    settings.set("sort_column", 2)
+    assert not settings.journal_file.exists()
+    assert settings.get("sort_column") == 2
+
+    qtbot.waitUntil(settings.journal_file.exists, timeout=2000)
+    assert [json.loads(line) for line in settings.journal_file.read_bytes().splitlines()] == [{"sort_column": 2}]
+    assert not settings.config_file.exists()
+
+
+def test_journal_is_replayed_on_load(qapp, settings, monkeypatch):
+    settings.save_settings()
+    settings.set("sort_order", 1)
+    settings._flush()
+    # A torn write from a crash is ignored
+    with open(settings.journal_file, 'ab') as f:
+        f.write(b'{"sort_or')
+
+    monkeypatch.setattr(Settings, '_instance', None)
+    assert Settings().get("sort_order") == 1
+
+
+def test_large_journal_is_compacted(qapp, settings, monkeypatch):
+    monkeypatch.setattr(Settings, 'JOURNAL_MAX_BYTES', 64)
+    for width in range(100, 106):
+        settings.set_column_widths((width, 80, 120))
+        settings._flush()
+
+    assert not settings.journal_file.exists()
+    assert _read(settings)["column_widths"] == [105, 80, 120]
+
+
+def test_save_settings_writes_immediately(qapp, settings):
+    settings.set_column_widths((300, 80, 120))
+    settings.save_settings()
+
+    assert _read(settings)["column_widths"] == [300, 80, 120]
+    assert not settings._flush_timer.isActive()
+    # Journal merged in, no temp file left behind
+    assert list(settings.config_dir.iterdir()) == [settings.config_file]
+
+
+def test_settings_loaded_from_disk(qapp, settings, monkeypatch):
+    settings.set("show_hidden", False)
+    settings.save_settings()
+
+    monkeypatch.setattr(Settings, '_instance', None)
+    assert Settings().get("show_hidden") is False
+
+
+def test_settings_file_is_indented_json(qapp, settings):
+    settings.set("sort_column", 3)
+    settings.save_settings()
+
+    text = settings.config_file.read_text()
+    assert json.loads(text)["sort_column"] == 3
+    assert '\n  "sort_column": 3' in text
+
+
+def test_geometry_round_trip_is_decoded_once(qapp, settings, monkeypatch):
+    from PyQt6.QtCore import QByteArray
+    import base64
+    settings.set("window_geometry", QByteArray(b"\x01\x02geometry"))
+
+    decode_calls = []
+    original = base64.b64decode
+    monkeypatch.setattr(base64, 'b64decode', lambda data: decode_calls.append(data) or original(data))
+
+    assert settings.get("window_geometry") == QByteArray(b"\x01\x02geometry")
+    assert settings.get("window_geometry") == QByteArray(b"\x01\x02geometry")
+    assert len(decode_calls) == 1
+
+    settings.set("window_geometry", QByteArray(b"new"))
+    assert settings.get("window_geometry") == QByteArray(b"new")
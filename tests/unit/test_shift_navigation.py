@@ -18,6 +18,8 @@ from PyQt6.QtTest import QTest
 from ui.file_list_view import FileListView
 import pytest
 
+pytestmark = pytest.mark.usefixtures('qapp')
+
 @pytest.mark.skip("Unstable in aggregate run: abort in PyQt event processing. Needs isolation / refactor.")
 def test_shift_navigation():
     """Test shift+navigation key combinations extend selection properly"""
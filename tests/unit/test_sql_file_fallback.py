@@ -101,5 +101,22 @@ def test_mime_types_order_for_sql():
     assert text_like_apps['application/sql'][1] == 'text/plain'
 
 
+def test_mime_chain_cached_per_mime_type(tmp_path):
+    """Test that the fallback chain is built once per MIME type and not shared."""
+    first = tmp_path / "a.sql"
+    second = tmp_path / "b.sql"
+    first.write_text("SELECT 1;")
+    second.write_text("SELECT 2;")
+    app_manager = ApplicationManager()
+
+    ApplicationManager._mime_chain.cache_clear()
+    chain = app_manager._get_mime_types_for_file(str(first))
+    chain.append('application/x-extra')
+    again = app_manager._get_mime_types_for_file(str(second))
+
+    assert ApplicationManager._mime_chain.cache_info().hits == 1
+    assert 'application/x-extra' not in again
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,109 @@
+"""
+Unit tests for the transfer progress widgets
+"""
+import sys
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+from core.file_transfer import FileTransferTask
+from ui.transfer_panel import TransferWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot, tmp_path):
+    task = FileTransferTask([str(tmp_path / "a"), str(tmp_path / "b")], str(tmp_path / "dest"), move=False)
+    tw = TransferWidget(task)
+    qtbot.addWidget(tw)
+    return tw
+
+
+def test_progress_updates_are_coalesced(qtbot, widget):
+    for done in range(0, 1000, 10):
+        widget.task.progress_changed.emit(done, 1000)
+    assert widget.progress.value() == -1  # Not updated yet
+
+    qtbot.waitUntil(lambda: widget.progress.value() == 99, timeout=1000)
+    assert widget._pending is None
+
+
+def test_finish_applies_pending_progress(qtbot, widget):
+    widget.task.progress_changed.emit(500, 1000)
+    widget.task.progress_changed.emit(1000, 1000)
+    widget.task.finished.emit(True, "")
+
+    assert not widget._ui_timer.isActive()
+    assert widget._pending is None
+    assert widget.progress.value() == 100
+    assert widget.label.text() == "Completed"
+
+
+def test_speed_formatting():
+    from ui.transfer_panel import _fmt_bps
+    assert _fmt_bps(0) == "0.0 B/s"
+    assert _fmt_bps(1536) == "1.5 KB/s"
+    assert _fmt_bps(5 * 1024 ** 2) == "5.0 MB/s"
+    assert _fmt_bps(3 * 1024 ** 4) == "3072.0 GB/s"
+    assert _fmt_bps(1023.4) == "1023.4 B/s"
+
+
+def test_speed_cache_keyed_on_displayed_value():
+    from ui.transfer_panel import _fmt_bps, _fmt_speed_tenths
+    _fmt_speed_tenths.cache_clear()
+    # All shown as "5.0 MB/s"
+    for bps in (5 * 1024 ** 2, 5 * 1024 ** 2 + 1234, 5 * 1024 ** 2 - 4321):
+        assert _fmt_bps(bps) == "5.0 MB/s"
+
+    info = _fmt_speed_tenths.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_speed_uses_recent_window(widget, monkeypatch):
+    import ui.transfer_panel as transfer_panel
+    clock = [widget._start_time]
+    monkeypatch.setattr(transfer_panel.time, 'monotonic', lambda: clock[0])
+
+    # 10 s at 1 MB/s, then 4 s at 4 MB/s
+    mb = 1024 ** 2
+    done = 0
+    for step in range(140):
+        clock[0] += 0.1
+        done += (mb if step < 100 else 4 * mb) // 10
+        widget._on_progress(done, 1000 * mb)
+        widget._flush_ui()
+
+    assert "4.0 MB/s" in widget.label.text()
+    assert len(widget._samples) <= 32
+
+
+def test_panel_reuses_finished_widgets(qapp, qtbot, tmp_path, monkeypatch):
+    from ui.transfer_panel import TransferPanel
+    panel = TransferPanel()
+    qtbot.addWidget(panel)
+    cleanups = []
+    monkeypatch.setattr(panel, '_cleanup_later', cleanups.append)
+    first = FileTransferTask([str(tmp_path / "a")], str(tmp_path / "dest"), move=False)
+    panel.add_task(first)
+    tw = panel.layout().itemAt(0).widget()
+    first.finished.emit(True, "")
+    assert tw.label.text() == "Completed"
+    assert cleanups == [tw]
+
+    panel._remove(tw)
+    assert panel.layout().count() == 0
+
+    second = FileTransferTask([str(tmp_path / "b")], str(tmp_path / "dest"), move=False)
+    panel.add_task(second)
+    assert panel.layout().itemAt(0).widget() is tw
+    assert tw.task is second
+    assert tw.label.text() == "Preparing..."
+    assert tw.btn_cancel.isEnabled()
+
+    # The old task no longer drives the reused widget or schedules its removal
+    first.finished.emit(False, "stale")
+    assert tw.label.text() == "Preparing..."
+    assert cleanups == [tw]
+
+    second.finished.emit(True, "")
+    assert cleanups == [tw, tw]